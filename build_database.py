@@ -16,8 +16,10 @@ import sqlite3
 import json
 import os
 import sys
-import shutil
-from typing import List, Dict, Tuple, Optional
+import itertools
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Tuple, Optional, Iterable, Iterator
 from datetime import datetime
 
 # Try to import MeCab if available
@@ -28,36 +30,129 @@ except ImportError:
     MECAB_AVAILABLE = False
     print("⚠️  MeCab not available - will use basic tokenization")
 
+# Per-item debug output in the radical ingest loops and the 人/火 spot checks
+# between build stages (set BUILD_DB_DEBUG=1 to enable)
+DEBUG = os.environ.get("BUILD_DB_DEBUG") == "1"
+
+# Use orjson for parsing if available (much faster on the large dictionary files)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Use ijson to stream JMdict entries if available, instead of materializing
+# the whole parsed file before the first row is inserted
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Both parsers accept bytes, so files can be read in binary mode either way
+json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+EMPTY_JSON_LIST = "[]"
+
+def json_dumps_list(values) -> str:
+    """Serialize a list (or a single value, as a one-element list) to JSON text, leaving non-ASCII unescaped
+
+    Keeps json.dumps' default ", " item separator: the app reads these columns
+    as text and splits readings and meanings on ", " (DictionaryDatabase.kt),
+    so this must not use compact JSON.
+    """
+    if isinstance(values, list):
+        # Most optional KanjiDic fields are empty; skip the serializer for them
+        if not values:
+            return EMPTY_JSON_LIST
+    else:
+        values = [values]
+    return json.dumps(values, ensure_ascii=False)
+
+# Common JMnedict tags that indicate a proper name, not a dictionary word.
+PURE_PROPER_NOUN_NAME_TYPES = frozenset({
+    'fem', 'masc', 'given', 'surname', 'person', 'char', 'place', 'station',
+    'company', 'organization', 'group', 'product', 'serv', 'work', 'ev', 'obj',
+    'creat', 'dei', 'myth', 'leg', 'ship', 'doc', 'relig', 'fict', 'oth', 'unclass'
+})
+
+# Map JMDict POS tags to Japanese POS tags used in frequency CSV
+FREQUENCY_POS_MAPPING = {
+    'pn': '名詞',      # pronoun -> noun
+    'n': '名詞',       # noun
+    'v1': '動詞',      # ichidan verb
+    'v5': '動詞',      # godan verb
+    'adj-i': '形容詞',  # i-adjective
+    'adj-na': '形容動詞', # na-adjective
+    'adv': '副詞',     # adverb
+    'prt': '助詞',     # particle
+    'conj': '接続詞',   # conjunction
+    'int': '感動詞',    # interjection
+    'pref': '接頭詞',   # prefix
+    'suf': '接尾詞',    # suffix
+    'aux-v': '助動詞',  # auxiliary verb
+}
+
+# ぁ..ん -> ァ..ン (katakana block is offset by 96 code points)
+HIRAGANA_TO_KATAKANA = {cp: cp + 96 for cp in range(ord('ぁ'), ord('ん') + 1)}
+
+# IDC (Ideographic Description Characters) plus whitespace, dropped from
+# makemeahanzi decompositions. All Unicode whitespace sits at or below U+3000.
+IDC_DELETE_TABLE = str.maketrans('', '', '⿰⿱⿲⿳⿴⿵⿶⿷⿸⿹⿺⿻')
+IDC_DELETE_TABLE.update({cp: None for cp in range(0x3001) if chr(cp).isspace()})
+
+# Kangxi radical number -> Japanese radical name
+KANGXI_RADICAL_NAMES = {
+    1: "一", 2: "丨", 3: "丶", 4: "丿", 5: "乙", 6: "亅", 7: "二", 8: "亠", 9: "人", 10: "儿",
+    11: "入", 12: "八", 13: "冂", 14: "冖", 15: "冫", 16: "几", 17: "凵", 18: "刀", 19: "力", 20: "勹",
+    21: "匕", 22: "匚", 23: "匸", 24: "十", 25: "卜", 26: "卩", 27: "厂", 28: "厶", 29: "又", 30: "口",
+    31: "囗", 32: "土", 33: "士", 34: "夂", 35: "夊", 36: "夕", 37: "大", 38: "女", 39: "子", 40: "宀",
+    41: "寸", 42: "小", 43: "尢", 44: "尸", 45: "屮", 46: "山", 47: "川", 48: "工", 49: "己", 50: "巾",
+    51: "干", 52: "幺", 53: "广", 54: "廴", 55: "廾", 56: "弋", 57: "弓", 58: "彐", 59: "彡", 60: "彳",
+    61: "心", 62: "戈", 63: "戸", 64: "手", 65: "支", 66: "攴", 67: "文", 68: "斗", 69: "斤", 70: "方",
+    71: "无", 72: "日", 73: "曰", 74: "月", 75: "木", 76: "欠", 77: "止", 78: "歹", 79: "殳", 80: "毋",
+    81: "比", 82: "毛", 83: "氏", 84: "气", 85: "水", 86: "火", 87: "爪", 88: "父", 89: "爻", 90: "爿",
+    91: "片", 92: "牙", 93: "牛", 94: "犬", 95: "玄", 96: "玉", 97: "瓜", 98: "瓦", 99: "甘", 100: "生",
+    101: "用", 102: "田", 103: "疋", 104: "疒", 105: "癶", 106: "白", 107: "皮", 108: "皿", 109: "目", 110: "矛",
+    111: "矢", 112: "石", 113: "示", 114: "禸", 115: "禾", 116: "穴", 117: "立", 118: "竹", 119: "米", 120: "糸",
+    121: "缶", 122: "网", 123: "羊", 124: "羽", 125: "老", 126: "而", 127: "耒", 128: "耳", 129: "聿", 130: "肉",
+    131: "臣", 132: "自", 133: "至", 134: "臼", 135: "舌", 136: "舛", 137: "舟", 138: "艮", 139: "色", 140: "艸",
+    141: "虍", 142: "虫", 143: "血", 144: "行", 145: "衣", 146: "襾", 147: "見", 148: "角", 149: "言", 150: "谷",
+    151: "豆", 152: "豕", 153: "豸", 154: "貝", 155: "赤", 156: "走", 157: "足", 158: "身", 159: "車", 160: "辛",
+    161: "辰", 162: "辵", 163: "邑", 164: "酉", 165: "釆", 166: "里", 167: "金", 168: "長", 169: "門", 170: "阜",
+    171: "隶", 172: "隹", 173: "雨", 174: "青", 175: "非", 176: "面", 177: "革", 178: "韋", 179: "韭", 180: "音",
+    181: "頁", 182: "風", 183: "飛", 184: "食", 185: "首", 186: "香", 187: "馬", 188: "骨", 189: "高", 190: "髟",
+    191: "鬥", 192: "鬯", 193: "鬲", 194: "鬼", 195: "魚", 196: "鳥", 197: "鹵", 198: "鹿", 199: "麦", 200: "麻",
+    201: "黄", 202: "黍", 203: "黒", 204: "黹", 205: "黽", 206: "鼎", 207: "鼓", 208: "鼠", 209: "鼻", 210: "齊",
+    211: "齒", 212: "竜", 213: "亀", 214: "龠"
+}
+
+# Pre-serialized radical_names column value for each radical
+RADICAL_NAMES_JSON = {number: json_dumps_list([name]) for number, name in KANGXI_RADICAL_NAMES.items()}
+
+def first_present(mapping: Dict, *keys, default=None):
+    """Return the value of the first key whose value isn't None, looking keys up only as needed"""
+    for key in keys:
+        value = mapping.get(key)
+        if value is not None:
+            return value
+    return default
+
+def executemany_chunked(cursor: sqlite3.Cursor, sql: str, rows, chunk_size: int = 10000) -> None:
+    """Run executemany over rows in fixed-size chunks rather than one huge call"""
+    rows = iter(rows)
+    while True:
+        chunk = list(itertools.islice(rows, chunk_size))
+        if not chunk:
+            break
+        cursor.executemany(sql, chunk)
+
 def get_radical_name(radical_number: int) -> str:
     """
     Map Kangxi radical numbers to their Japanese names.
     This is a subset of the most common radicals.
     """
-    radical_names = {
-        1: "一", 2: "丨", 3: "丶", 4: "丿", 5: "乙", 6: "亅", 7: "二", 8: "亠", 9: "人", 10: "儿",
-        11: "入", 12: "八", 13: "冂", 14: "冖", 15: "冫", 16: "几", 17: "凵", 18: "刀", 19: "力", 20: "勹",
-        21: "匕", 22: "匚", 23: "匸", 24: "十", 25: "卜", 26: "卩", 27: "厂", 28: "厶", 29: "又", 30: "口",
-        31: "囗", 32: "土", 33: "士", 34: "夂", 35: "夊", 36: "夕", 37: "大", 38: "女", 39: "子", 40: "宀",
-        41: "寸", 42: "小", 43: "尢", 44: "尸", 45: "屮", 46: "山", 47: "川", 48: "工", 49: "己", 50: "巾",
-        51: "干", 52: "幺", 53: "广", 54: "廴", 55: "廾", 56: "弋", 57: "弓", 58: "彐", 59: "彡", 60: "彳",
-        61: "心", 62: "戈", 63: "戸", 64: "手", 65: "支", 66: "攴", 67: "文", 68: "斗", 69: "斤", 70: "方",
-        71: "无", 72: "日", 73: "曰", 74: "月", 75: "木", 76: "欠", 77: "止", 78: "歹", 79: "殳", 80: "毋",
-        81: "比", 82: "毛", 83: "氏", 84: "气", 85: "水", 86: "火", 87: "爪", 88: "父", 89: "爻", 90: "爿",
-        91: "片", 92: "牙", 93: "牛", 94: "犬", 95: "玄", 96: "玉", 97: "瓜", 98: "瓦", 99: "甘", 100: "生",
-        101: "用", 102: "田", 103: "疋", 104: "疒", 105: "癶", 106: "白", 107: "皮", 108: "皿", 109: "目", 110: "矛",
-        111: "矢", 112: "石", 113: "示", 114: "禸", 115: "禾", 116: "穴", 117: "立", 118: "竹", 119: "米", 120: "糸",
-        121: "缶", 122: "网", 123: "羊", 124: "羽", 125: "老", 126: "而", 127: "耒", 128: "耳", 129: "聿", 130: "肉",
-        131: "臣", 132: "自", 133: "至", 134: "臼", 135: "舌", 136: "舛", 137: "舟", 138: "艮", 139: "色", 140: "艸",
-        141: "虍", 142: "虫", 143: "血", 144: "行", 145: "衣", 146: "襾", 147: "見", 148: "角", 149: "言", 150: "谷",
-        151: "豆", 152: "豕", 153: "豸", 154: "貝", 155: "赤", 156: "走", 157: "足", 158: "身", 159: "車", 160: "辛",
-        161: "辰", 162: "辵", 163: "邑", 164: "酉", 165: "釆", 166: "里", 167: "金", 168: "長", 169: "門", 170: "阜",
-        171: "隶", 172: "隹", 173: "雨", 174: "青", 175: "非", 176: "面", 177: "革", 178: "韋", 179: "韭", 180: "音",
-        181: "頁", 182: "風", 183: "飛", 184: "食", 185: "首", 186: "香", 187: "馬", 188: "骨", 189: "高", 190: "髟",
-        191: "鬥", 192: "鬯", 193: "鬲", 194: "鬼", 195: "魚", 196: "鳥", 197: "鹵", 198: "鹿", 199: "麦", 200: "麻",
-        201: "黄", 202: "黍", 203: "黒", 204: "黹", 205: "黽", 206: "鼎", 207: "鼓", 208: "鼠", 209: "鼻", 210: "齊",
-        211: "齒", 212: "竜", 213: "亀", 214: "龠"
-    }
-    return radical_names.get(radical_number, "")
+    return KANGXI_RADICAL_NAMES.get(radical_number, "")
 
 class DatabaseBuilder:
     def __init__(self, output_path: str = "app/src/main/assets/databases/jmdict_fts5.db"):
@@ -159,7 +254,7 @@ class DatabaseBuilder:
             print(f"⚠️  Error loading frequency data: {e}")
 
     def create_database_schema(self, conn: sqlite3.Connection) -> None:
-        """Create all necessary tables and indexes"""
+        """Create all necessary tables (secondary indexes come later, see create_indexes)"""
         cursor = conn.cursor()
 
         print("📋 Creating database schema...")
@@ -181,12 +276,6 @@ class DatabaseBuilder:
             )
         """)
 
-        # Create indexes for performance
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_reading ON dictionary_entries(reading)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_kanji ON dictionary_entries(kanji)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_common ON dictionary_entries(is_common)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_frequency ON dictionary_entries(frequency)")
-
         # Create FTS5 virtual tables
         print("📊 Creating FTS5 virtual tables...")
 
@@ -239,15 +328,12 @@ class DatabaseBuilder:
             CREATE TABLE IF NOT EXISTS word_tags (
                 entry_id INTEGER,
                 tag TEXT,
+                PRIMARY KEY(entry_id, tag),
                 FOREIGN KEY(entry_id) REFERENCES dictionary_entries(id) ON DELETE CASCADE,
                 FOREIGN KEY(tag) REFERENCES tag_definitions(tag) ON DELETE CASCADE
             )
         """)
 
-        # Create indexes for tag tables
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_word_tags_entry ON word_tags(entry_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_word_tags_tag ON word_tags(tag)")
-
         # Pitch accent table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS pitch_accents (
@@ -272,20 +358,50 @@ class DatabaseBuilder:
             )
         """)
 
-        # Create indexes for pitch accent table
+        print("✅ Dictionary database schema created")
+
+        # Create KanjiDic tables in the same database
+        self.create_kanjidic_schema(conn)
+        conn.commit()
+
+    def create_indexes(self, conn: sqlite3.Connection) -> None:
+        """Create secondary indexes once the tables are fully populated"""
+        cursor = conn.cursor()
+
+        print("📇 Creating indexes...")
+
+        # Dictionary entries
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_reading ON dictionary_entries(reading)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_kanji ON dictionary_entries(kanji)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_common ON dictionary_entries(is_common)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_frequency ON dictionary_entries(frequency)")
+
+        # Tag tables
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_word_tags_entry ON word_tags(entry_id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_word_tags_tag ON word_tags(tag)")
+
+        # Pitch accent table
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_pitch_kanji ON pitch_accents(kanji_form)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_pitch_reading ON pitch_accents(reading)")
-        
-        # Create indexes for word variants table
+
+        # Word variants table
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_wv_primary ON word_variants(primary_kanji)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_wv_variant ON word_variants(variant_kanji)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_wv_jmdict ON word_variants(jmdict_id)")
 
-        print("✅ Dictionary database schema created")
+        # KanjiDic entries
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_kanji ON kanji_entries(kanji)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_jlpt ON kanji_entries(jlpt_level)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_grade ON kanji_entries(grade)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_frequency ON kanji_entries(frequency)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_stroke_count ON kanji_entries(stroke_count)")
+
+        # Radical tables
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_radical_stroke_count ON radical_kanji_mapping(stroke_count)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_decomposition_component_count ON radical_decomposition_mapping(component_count)")
 
-        # Create KanjiDic tables in the same database
-        self.create_kanjidic_schema(conn)
         conn.commit()
+        print("✅ Indexes created")
 
     def populate_tag_definitions(self, conn: sqlite3.Connection) -> None:
         """Populate tag definitions table with JMdict POS tags"""
@@ -583,7 +699,7 @@ class DatabaseBuilder:
 
         for tag, description in tag_definitions.items():
             cursor.execute("""
-                INSERT OR REPLACE INTO tag_definitions (tag, description)
+                INSERT INTO tag_definitions (tag, description)
                 VALUES (?, ?)
             """, (tag, description))
 
@@ -603,8 +719,8 @@ class DatabaseBuilder:
         print("🎵 Populating pitch accent data...")
         
         try:
-            with open(accents_file, 'r', encoding='utf-8') as f:
-                accent_data = json.load(f)
+            with open(accents_file, 'rb') as f:
+                accent_data = json_loads(f.read())
             
             if 'accents' not in accent_data:
                 print("❌ Invalid accent data format")
@@ -620,7 +736,7 @@ class DatabaseBuilder:
                         accent_pattern = ','.join(map(str, accent_numbers))
                         
                         cursor.execute("""
-                            INSERT OR REPLACE INTO pitch_accents 
+                            INSERT INTO pitch_accents 
                             (kanji_form, reading, accent_pattern)
                             VALUES (?, ?, ?)
                         """, (kanji_form, reading, accent_pattern))
@@ -656,8 +772,8 @@ class DatabaseBuilder:
         print("🔗 Populating word variants...")
         
         try:
-            with open(jmdict_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(jmdict_file, 'rb') as f:
+                data = json_loads(f.read())
             
             count = 0
             bidirectional_count = 0
@@ -781,56 +897,30 @@ class DatabaseBuilder:
         Assigns 0 frequency to known "pure proper noun" types to avoid false high rankings.
         """
         if parts_of_speech:
-            # These are common JMnedict tags that indicate a proper name, not a dictionary word.
-            pure_proper_noun_name_types = {
-                'fem', 'masc', 'given', 'surname', 'person', 'char', 'place', 'station',
-                'company', 'organization', 'group', 'product', 'serv', 'work', 'ev', 'obj',
-                'creat', 'dei', 'myth', 'leg', 'ship', 'doc', 'relig', 'fict', 'oth', 'unclass'
-            }
-
             # Check if any of the entry's POS/name tags match our pure proper noun types.
-            if any(tag in pure_proper_noun_name_types for tag in parts_of_speech):
+            if not PURE_PROPER_NOUN_NAME_TYPES.isdisjoint(parts_of_speech):
                 return 0 # Assign 0 frequency to avoid contaminating general word frequencies.
 
         # Use unique key lookup to match how frequency data was stored
         if kana_reading and parts_of_speech:
+            frequency_data = self.frequency_data
+
             # Convert reading to katakana for frequency lookup (frequency CSV uses katakana)
-            import unicodedata
-            katakana_reading = ''.join(
-                chr(ord(ch) + 96) if 'ぁ' <= ch <= 'ん' else ch 
-                for ch in kana_reading
-            )
-            
-            # Map JMDict POS tags to Japanese POS tags used in frequency CSV
-            pos_mapping = {
-                'pn': '名詞',      # pronoun -> noun
-                'n': '名詞',       # noun
-                'v1': '動詞',      # ichidan verb
-                'v5': '動詞',      # godan verb
-                'adj-i': '形容詞',  # i-adjective
-                'adj-na': '形容動詞', # na-adjective
-                'adv': '副詞',     # adverb
-                'prt': '助詞',     # particle
-                'conj': '接続詞',   # conjunction
-                'int': '感動詞',    # interjection
-                'pref': '接頭詞',   # prefix
-                'suf': '接尾詞',    # suffix
-                'aux-v': '助動詞',  # auxiliary verb
-            }
+            katakana_reading = kana_reading.translate(HIRAGANA_TO_KATAKANA)
             
             # Try different POS tag combinations
-            primary_pos = parts_of_speech[0] if parts_of_speech else ""
-            mapped_pos = pos_mapping.get(primary_pos, primary_pos)
+            primary_pos = parts_of_speech[0]
+            mapped_pos = FREQUENCY_POS_MAPPING.get(primary_pos, primary_pos)
             
             # Try with mapped POS and katakana reading first
-            unique_key = f"{word}|{mapped_pos}|{katakana_reading}"
-            if unique_key in self.frequency_data:
-                return self.frequency_data[unique_key]
+            frequency = frequency_data.get(f"{word}|{mapped_pos}|{katakana_reading}")
+            if frequency is not None:
+                return frequency
             
             # Try with original reading (some entries might use hiragana)
-            unique_key = f"{word}|{mapped_pos}|{kana_reading}"
-            if unique_key in self.frequency_data:
-                return self.frequency_data[unique_key]
+            frequency = frequency_data.get(f"{word}|{mapped_pos}|{kana_reading}")
+            if frequency is not None:
+                return frequency
             
             # For 私 specifically, try the known frequency data keys
             if word == "私":
@@ -848,14 +938,40 @@ class DatabaseBuilder:
         # No exact match found - return 0 (no fallback to avoid incorrect frequency inheritance)
         return 0
 
-    def load_jmdict_data(self, file_path: str) -> List[Dict]:
-        """Load JMdict data from JSON file"""
+    def _stream_jmdict_entries(self, file_path: str) -> Iterator[Dict]:
+        """Yield JMdict entries one at a time with ijson (new or old format)"""
+        with open(file_path, 'rb') as f:
+            # New format is an object with a 'words' array, old format a bare array
+            first_char = f.read(4096).lstrip(b'\xef\xbb\xbf \t\r\n')[:1]
+            f.seek(0)
+            prefix = 'item' if first_char == b'[' else 'words.item'
+            yield from ijson.items(f, prefix, use_float=True)
+
+    def load_jmdict_data(self, file_path: str) -> Iterable[Dict]:
+        """Load JMdict data from JSON file
+
+        With ijson installed the entries are streamed lazily instead of being
+        returned as a list.
+        """
         print(f"📖 Loading JMdict data from {file_path}...")
 
-        if os.path.exists(file_path):
+        if os.path.exists(file_path) and IJSON_AVAILABLE:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                entries = self._stream_jmdict_entries(file_path)
+                # Pull the first entry now so an empty or unreadable file is reported here
+                first_entry = next(entries, None)
+                if first_entry is None:
+                    print(f"❌ Unexpected JMdict format")
+                    return []
+                print(f"✅ Streaming entries from JMdict file (ijson)")
+                return itertools.chain((first_entry,), entries)
+            except Exception as e:
+                print(f"❌ Failed to load JMdict data from {file_path}: {e}")
+                return []
+        elif os.path.exists(file_path):
+            try:
+                with open(file_path, 'rb') as f:
+                    data = json_loads(f.read())
                 
                 # Handle new JMdict format with metadata and words array
                 if isinstance(data, dict) and 'words' in data:
@@ -886,8 +1002,8 @@ class DatabaseBuilder:
             return {}
 
         try:
-            with open(tags_file_path, 'r', encoding='utf-8') as f:
-                tag_data = json.load(f)
+            with open(tags_file_path, 'rb') as f:
+                tag_data = json_loads(f.read())
 
             # Process the tags data (JMdict structure)
             all_tags = {}
@@ -907,7 +1023,7 @@ class DatabaseBuilder:
             print(f"❌ Failed to load tags file: {e}")
             return {}
 
-    def populate_dictionary_entries(self, conn: sqlite3.Connection, entries_data: List[Dict], tags_data: Dict[str, List[str]]) -> None:
+    def populate_dictionary_entries(self, conn: sqlite3.Connection, entries_data: Iterable[Dict], tags_data: Dict[str, List[str]]) -> None:
         """Populate the main dictionary_entries table and word_tags table"""
         cursor = conn.cursor()
 
@@ -917,43 +1033,44 @@ class DatabaseBuilder:
         error_count = 0  # Track SQL errors
         max_errors = 100  # Maximum allowed errors before stopping
 
+        # word_tags rows are buffered and written with executemany; the entry
+        # rows themselves go one at a time because each id is needed for its tags.
+        tag_batch_size = 5000
+        tag_rows = []
+        tag_insert_sql = """
+            INSERT OR IGNORE INTO word_tags (entry_id, tag)
+            VALUES (?, ?)
+        """
+
+        # Only a few thousand distinct POS combinations exist across JMdict,
+        # so serialize each one once and reuse the string.
+        pos_json_cache = {}
 
-        batch_size = 1000  # Smaller batch size to prevent corruption
+        # Streamed entries have no length up front
+        total_label = f"/{len(entries_data)}" if isinstance(entries_data, list) else ""
+
+        # The whole source goes in as one transaction. Committing every 1000
+        # entries (plus a full integrity_check every 10000) cost far more than
+        # the inserts on a build that is simply re-run if it fails.
+        if conn.in_transaction:
+            conn.commit()
+        conn.execute("BEGIN")
         
         for i, entry in enumerate(entries_data):
-            # Debug: Track みる entries specifically
+            kanji_forms = [k['text'] for k in entry.get('kanji', [])]
             kana_forms = [k['text'] for k in entry.get('kana', [])]
+
+            # Debug: Track みる entries specifically
             if 'みる' in kana_forms:
-                kanji_forms = [k['text'] for k in entry.get('kanji', [])]
                 print(f"   🔍 Processing みる entry #{i}: kanji={kanji_forms}, kana={kana_forms}")
             
-            # Use smaller batches to prevent database corruption
-            if i > 0 and i % batch_size == 0:
-                try:
-                    conn.commit()
-                    # Perform integrity check periodically
-                    if i % 10000 == 0:
-                        print(f"   Progress: {i}/{len(entries_data)} entries...")
-                        check_cursor = conn.execute("PRAGMA integrity_check")
-                        result = check_cursor.fetchone()[0]
-                        if result != "ok":
-                            print(f"   ⚠️  Database integrity issue detected: {result}")
-                            raise sqlite3.DatabaseError("Database integrity check failed")
-                except sqlite3.DatabaseError as e:
-                    print(f"   ❌ Database error during commit: {e}")
-                    if "database disk image is malformed" in str(e):
-                        print("   🚨 CRITICAL: Database corruption detected. Stopping build.")
-                        raise
-                    # Try to recover by rolling back
-                    try:
-                        conn.rollback()
-                        print("   🔄 Rolled back transaction, continuing...")
-                    except:
-                        raise
+            if i > 0 and i % 10000 == 0:
+                print(f"   Progress: {i}{total_label} entries...")
 
             # Handle new format with 'sense' array (JMdict)
             meanings = []
             parts_of_speech_list = []
+            seen_pos = set()  # O(1) dedup while preserving first-seen order
             
             if 'sense' in entry:
                 # JMdict format
@@ -970,7 +1087,10 @@ class DatabaseBuilder:
                     # Extract parts of speech from each sense
                     # Support both 'partOfSpeech' (standard JMdict) and 'pos' (our custom entries)
                     pos_tags = sense.get('partOfSpeech', []) or sense.get('pos', [])
-                    parts_of_speech_list.extend(pos_tags)
+                    for tag in pos_tags:
+                        if tag not in seen_pos:
+                            seen_pos.add(tag)
+                            parts_of_speech_list.append(tag)
             elif 'translation' in entry:
                 # JMnedict format
                 for trans in entry.get('translation', []):
@@ -983,12 +1103,14 @@ class DatabaseBuilder:
                     
                     # Extract name types as parts of speech
                     name_types = trans.get('type', [])
-                    parts_of_speech_list.extend(name_types)
+                    for tag in name_types:
+                        if tag not in seen_pos:
+                            seen_pos.add(tag)
+                            parts_of_speech_list.append(tag)
                     
                     # Debug logging for JMnedict tag extraction
                     if is_jmnedict_source:
-                        kanji_forms_debug = [k['text'] for k in entry.get('kanji', [])]
-                        if '上' in kanji_forms_debug:
+                        if '上' in kanji_forms:
                             print(f"   🔍 JMnedict tag extraction for 上: name_types={name_types}")
             else:
                 # Old format fallback
@@ -999,38 +1121,48 @@ class DatabaseBuilder:
 
             meanings_json = json.dumps(meanings)
 
-            kanji_forms = [k['text'] for k in entry.get('kanji', [])]
-            kana_forms = [k['text'] for k in entry.get('kana', [])]
-
             # Collect additional POS tags from tags file (if not already populated from sense)
             if not parts_of_speech_list:
-                for word in kanji_forms + kana_forms:
-                    if word in tags_data:
-                        parts_of_speech_list.extend(tags_data[word])
+                for word in itertools.chain(kanji_forms, kana_forms):
+                    word_tags = tags_data.get(word)
+                    if not word_tags:
+                        continue
+                    for tag in word_tags:
+                        if tag not in seen_pos:
+                            seen_pos.add(tag)
+                            parts_of_speech_list.append(tag)
             
-            # Remove duplicates, preserve order
-            parts_of_speech_list = list(dict.fromkeys(parts_of_speech_list))
-            parts_of_speech_json = json.dumps(parts_of_speech_list)
+            # Stays JSON text: the app json-parses this column and english_fts
+            # matches against it. Compact separators keep the stored text small.
+            pos_key = tuple(parts_of_speech_list)
+            parts_of_speech_json = pos_json_cache.get(pos_key)
+            if parts_of_speech_json is None:
+                parts_of_speech_json = json.dumps(parts_of_speech_list, separators=(',', ':'))
+                pos_json_cache[pos_key] = parts_of_speech_json
 
             # is_common will be calculated per form now (not at entry level)
 
+            # Map each surface form to its (common, tags) metadata once per entry,
+            # so the kanji x kana cross product below doesn't rescan the form lists.
+            # setdefault keeps the first occurrence, matching the old next() lookup.
+            kanji_meta = {}
+            for k in entry.get('kanji', ()):
+                kanji_meta.setdefault(k['text'], (k.get('common', False), k.get('tags', [])))
+            kana_meta = {}
+            for k in entry.get('kana', ()):
+                kana_meta.setdefault(k['text'], (k.get('common', False), k.get('tags', [])))
+
             # Build forms with their metadata
             forms_to_insert = []
-            kanji_entries = entry.get('kanji', [])
-            kana_entries = entry.get('kana', [])
             
             if kanji_forms:
                 for kanji_text in kanji_forms:
-                    # Find the kanji entry object for this text
-                    kanji_entry = next((k for k in kanji_entries if k['text'] == kanji_text), {})
-                    kanji_common = kanji_entry.get('common', False)
-                    kanji_tags = kanji_entry.get('tags', [])  # Extract kanji-level tags (rK, iK, etc.)
+                    # Kanji-level tags (rK, iK, etc.)
+                    kanji_common, kanji_tags = kanji_meta[kanji_text]
                     
                     for kana_text in kana_forms:
-                        # Find the kana entry object for this text
-                        kana_entry = next((k for k in kana_entries if k['text'] == kana_text), {})
-                        kana_common = kana_entry.get('common', False)
-                        kana_tags = kana_entry.get('tags', [])  # Extract kana-level tags (rk, ik, etc.)
+                        # Kana-level tags (rk, ik, etc.)
+                        kana_common, kana_tags = kana_meta[kana_text]
                         
                         # Form is common if both kanji and kana are common
                         is_common = kanji_common and kana_common
@@ -1041,10 +1173,7 @@ class DatabaseBuilder:
                         forms_to_insert.append((kanji_text, kana_text, is_common, form_tags))
             elif kana_forms:
                 for kana_text in kana_forms:
-                    # Find the kana entry object for this text
-                    kana_entry = next((k for k in kana_entries if k['text'] == kana_text), {})
-                    kana_common = kana_entry.get('common', False)
-                    kana_tags = kana_entry.get('tags', [])  # Extract kana-level tags
+                    kana_common, kana_tags = kana_meta[kana_text]
                     
                     forms_to_insert.append((None, kana_text, kana_common, kana_tags))
 
@@ -1072,77 +1201,43 @@ class DatabaseBuilder:
                         print(f"      is_common: {is_common}")
                         print(f"      parts_of_speech: {parts_of_speech_list}")
                     
+                    # Upsert with a no-op DO UPDATE so RETURNING yields the row id whether
+                    # the form was inserted or already existed - no lastrowid read and no
+                    # follow-up SELECT for duplicates. (No triggers exist on
+                    # dictionary_entries yet; they are created after population.)
                     cursor.execute("""
-                        INSERT OR IGNORE INTO dictionary_entries
+                        INSERT INTO dictionary_entries
                         (kanji, reading, meanings, parts_of_speech, is_common,
                          frequency, tokenized_kanji, tokenized_reading)
                         VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                        ON CONFLICT(kanji, reading) DO UPDATE SET kanji = excluded.kanji
+                        RETURNING id
                     """, (kanji_form, kana_form, meanings_json, parts_of_speech_json,
                           1 if is_common else 0, frequency, tokenized_kanji, tokenized_reading))
-
-                    # Get the entry ID - check if entry was actually inserted
-                    if cursor.rowcount > 0:
-                        # Entry was inserted successfully
-                        entry_id = cursor.lastrowid
-                    else:
-                        # INSERT was ignored (duplicate), fetch the existing entry's ID
-                        cursor.execute("""
-                            SELECT id FROM dictionary_entries 
-                            WHERE reading = ? AND (kanji IS ? OR (kanji IS NULL AND ? IS NULL))
-                        """, (kana_form, kanji_form, kanji_form))
-                        result = cursor.fetchone()
-                        entry_id = result[0] if result else None
+                    entry_id = cursor.fetchone()[0]
                     
-                    # Debug logging for みる entries - check if insertion was successful
+                    # Debug logging for みる entries
                     if kana_form == 'みる':
-                        if entry_id:
-                            print(f"   ✅ DEBUG: みる entry inserted successfully with ID: {entry_id}")
-                        else:
-                            print(f"   ❌ DEBUG: みる entry insertion was ignored (likely duplicate)")
-                            # Check what existing entry conflicts
-                            cursor.execute("""
-                                SELECT id, kanji, reading, frequency, is_common 
-                                FROM dictionary_entries 
-                                WHERE reading = ? AND (kanji IS ? OR (kanji IS NULL AND ? IS NULL))
-                            """, (kana_form, kanji_form, kanji_form))
-                            existing = cursor.fetchone()
-                            if existing:
-                                print(f"      Existing entry: ID={existing[0]}, kanji={repr(existing[1])}, freq={existing[3]}, is_common={existing[4]}")
-                            else:
-                                print(f"      No conflicting entry found - insertion failed for other reason")
+                        print(f"   ✅ DEBUG: みる entry stored with ID: {entry_id}")
 
 
                     if entry_id:
-                        # Insert parts of speech tags
+                        # Queue parts of speech tags
                         for tag in parts_of_speech_list:
-                            try:
-                                cursor.execute("""
-                                    INSERT OR REPLACE INTO word_tags (entry_id, tag)
-                                    VALUES (?, ?)
-                                """, (entry_id, tag))
-                                tags_added += 1
-                                
-                            except sqlite3.Error as e:
-                                pass
+                            tag_rows.append((entry_id, tag))
                         
-                        # Insert kanji/kana form-specific tags (rK, iK, rk, ik, etc.)
+                        # Queue kanji/kana form-specific tags (rK, iK, rk, ik, etc.)
                         for tag in form_tags:
-                            try:
-                                cursor.execute("""
-                                    INSERT OR REPLACE INTO word_tags (entry_id, tag)
-                                    VALUES (?, ?)
-                                """, (entry_id, tag))
-                                tags_added += 1
-                                
-                                # Debug logging for もてあそぶ entries
-                                if kana_form == 'もてあそぶ':
-                                    print(f"         ✅ Inserted form tag: {tag} for {kanji_form}/{kana_form}")
-                            except sqlite3.Error as e:
-                                if kana_form == 'もてあそぶ':
-                                    print(f"         ❌ Failed to insert form tag: {tag} for {kanji_form}/{kana_form}, error: {e}")
-                                pass
-                    else:
-                        pass
+                            tag_rows.append((entry_id, tag))
+                            
+                            # Debug logging for もてあそぶ entries
+                            if kana_form == 'もてあそぶ':
+                                print(f"         ✅ Queued form tag: {tag} for {kanji_form}/{kana_form}")
+
+                        if len(tag_rows) >= tag_batch_size:
+                            cursor.executemany(tag_insert_sql, tag_rows)
+                            tags_added += cursor.rowcount
+                            tag_rows.clear()
                     entries_added += 1
                 except sqlite3.Error as e:
                     error_count += 1
@@ -1155,8 +1250,11 @@ class DatabaseBuilder:
                         raise RuntimeError(f"Too many SQL errors: {error_count}")
                     continue
 
-        # Final commit
+        # Flush the remaining tags, then the final commit
         try:
+            if tag_rows:
+                cursor.executemany(tag_insert_sql, tag_rows)
+                tags_added += cursor.rowcount
             conn.commit()
             print(f"✅ Added {entries_added} dictionary entries from this source")
             print(f"✅ Added {tags_added} word tags from this source")
@@ -1226,12 +1324,11 @@ class DatabaseBuilder:
 
     def create_triggers(self, conn: sqlite3.Connection) -> None:
         """Create triggers to keep FTS5 tables in sync"""
-        cursor = conn.cursor()
-
         print("🔧 Creating triggers...")
 
-        # Trigger for entries_fts5 (AFTER INSERT)
-        cursor.execute("""
+        # One executescript call instead of a round-trip per trigger
+        conn.executescript("""
+            -- Trigger for entries_fts5 (AFTER INSERT)
             CREATE TRIGGER IF NOT EXISTS entries_fts5_ai AFTER INSERT ON dictionary_entries
             BEGIN
                 INSERT INTO entries_fts5(rowid, kanji, reading, meanings, tokenized_kanji,
@@ -1240,11 +1337,9 @@ class DatabaseBuilder:
                 VALUES (new.id, new.kanji, new.reading, new.meanings, new.tokenized_kanji,
                         new.tokenized_reading, new.parts_of_speech,
                         new.is_common, new.frequency);
-            END
-        """)
+            END;
 
-        # Trigger for entries_fts5 (AFTER DELETE)
-        cursor.execute("""
+            -- Trigger for entries_fts5 (AFTER DELETE)
             CREATE TRIGGER IF NOT EXISTS entries_fts5_ad AFTER DELETE ON dictionary_entries
             BEGIN
                 INSERT INTO entries_fts5(entries_fts5, rowid, kanji, reading, meanings, tokenized_kanji,
@@ -1253,11 +1348,9 @@ class DatabaseBuilder:
                 VALUES ('delete', old.id, old.kanji, old.reading, old.meanings, old.tokenized_kanji,
                         old.tokenized_reading, old.parts_of_speech,
                         old.is_common, old.frequency);
-            END
-        """)
+            END;
 
-        # Trigger for entries_fts5 (AFTER UPDATE)
-        cursor.execute("""
+            -- Trigger for entries_fts5 (AFTER UPDATE)
             CREATE TRIGGER IF NOT EXISTS entries_fts5_au AFTER UPDATE ON dictionary_entries
             BEGIN
                 INSERT INTO entries_fts5(entries_fts5, rowid, kanji, reading, meanings, tokenized_kanji,
@@ -1272,31 +1365,25 @@ class DatabaseBuilder:
                 VALUES (new.id, new.kanji, new.reading, new.meanings, new.tokenized_kanji,
                         new.tokenized_reading, new.parts_of_speech,
                         new.is_common, new.frequency);
-            END
-        """)
+            END;
 
-        # english_fts triggers remain the same as they don't use these new columns
-        cursor.execute("""
+            -- english_fts triggers remain the same as they don't use these new columns
             CREATE TRIGGER IF NOT EXISTS english_fts_ai AFTER INSERT ON dictionary_entries
             BEGIN
                 INSERT INTO english_fts(entry_id, meanings, parts_of_speech)
                 VALUES (new.id, new.meanings, new.parts_of_speech);
-            END
-        """)
+            END;
 
-        cursor.execute("""
             CREATE TRIGGER IF NOT EXISTS english_fts_ad AFTER DELETE ON dictionary_entries
             BEGIN
                 DELETE FROM english_fts WHERE entry_id = old.id;
-            END
-        """)
+            END;
 
-        cursor.execute("""
             CREATE TRIGGER IF NOT EXISTS english_fts_au AFTER UPDATE ON dictionary_entries
             BEGIN
                 UPDATE english_fts SET meanings = new.meanings, parts_of_speech = new.parts_of_speech
                 WHERE entry_id = old.id;
-            END
+            END;
         """)
 
         print("✅ Triggers created")
@@ -1400,13 +1487,6 @@ class DatabaseBuilder:
             )
         """)
 
-        # Create indexes
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_kanji ON kanji_entries(kanji)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_jlpt ON kanji_entries(jlpt_level)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_grade ON kanji_entries(grade)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_frequency ON kanji_entries(frequency)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_stroke_count ON kanji_entries(stroke_count)")
-
         # Kanji radical mapping tables (from kradfile.json)
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS kanji_radical_mapping (
@@ -1431,10 +1511,6 @@ class DatabaseBuilder:
             )
         """)
 
-        # Create indexes for radical tables
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_radical_stroke_count ON radical_kanji_mapping(stroke_count)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_decomposition_component_count ON radical_decomposition_mapping(component_count)")
-
         # No FTS5 tables needed for kanji - direct lookup is sufficient
 
         print("✅ KanjiDic database schema created")
@@ -1448,10 +1524,16 @@ class DatabaseBuilder:
             return None
             
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                data = json_loads(f.read())
             
             kanji_data = data.get('kanji', {})
+            
+            # Normalize components to lists once so the populate loops can skip type checks
+            for kanji, components in kanji_data.items():
+                if not isinstance(components, list):
+                    kanji_data[kanji] = [components] if components else []
+            
             print(f"✅ Loaded {len(kanji_data)} kanji entries from kradfile")
             return kanji_data
             
@@ -1468,11 +1550,18 @@ class DatabaseBuilder:
             return None
             
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                data = json_loads(f.read())
             
             # Extract the radicals data
             radicals_data = data.get('radicals', {})
+            
+            # Normalize kanji lists once so the populate loops can skip type checks
+            for info in radicals_data.values():
+                kanji_list = info.get('kanji', [])
+                if not isinstance(kanji_list, list):
+                    info['kanji'] = [kanji_list] if kanji_list else []
+            
             print(f"✅ Loaded {len(radicals_data)} radical entries from radkfile")
             return radicals_data
             
@@ -1486,14 +1575,12 @@ class DatabaseBuilder:
         
         print("🔧 Populating kanji radical mapping...")
         
-        for kanji, components in kradfile_data.items():
-            # Convert list of components to comma-separated string
-            components_str = ", ".join(components) if isinstance(components, list) else str(components)
-            
-            cursor.execute("""
-                INSERT OR REPLACE INTO kanji_radical_mapping (kanji, components)
-                VALUES (?, ?)
-            """, (kanji, components_str))
+        # Convert each list of components to a comma-separated string
+        rows = [(kanji, ", ".join(components)) for kanji, components in kradfile_data.items()]
+        cursor.executemany("""
+            INSERT INTO kanji_radical_mapping (kanji, components)
+            VALUES (?, ?)
+        """, rows)
         
         conn.commit()
         print(f"✅ Added {len(kradfile_data)} kanji component mappings")
@@ -1522,36 +1609,30 @@ class DatabaseBuilder:
         }
         
         # Build radical -> kanji mapping from kradfile
-        radical_to_kanji = {}
+        radical_to_kanji = defaultdict(list)
         
         print("  📝 Inverting kradfile (kanji → components) to (radical → kanji list)...")
-        for kanji, components in kradfile_data.items():
-            if isinstance(components, list):
-                for radical in components:
-                    # Apply Unicode normalization to radicals
-                    normalized_radical = unicode_normalization.get(radical, radical)
-                    
-                    if normalized_radical not in radical_to_kanji:
-                        radical_to_kanji[normalized_radical] = []
-                    radical_to_kanji[normalized_radical].append(kanji)
-                    
-                    # Debug spirit radical normalization
-                    if radical in ["⺭", "礻"]:
-                        print(f"    🔧 Normalized '{radical}' → '{normalized_radical}' for kanji '{kanji}'")
-                    
-                    # Debug 人 radical specifically
-                    if normalized_radical == '人' and kanji == '火':
-                        print(f"    🎯 Found 火 with 人 component in kradfile!")
+        # Walk the kanji in sorted order so every radical's list comes out sorted
+        for kanji in sorted(kradfile_data):
+            for radical in kradfile_data[kanji]:
+                # Apply Unicode normalization to radicals
+                normalized_radical = unicode_normalization.get(radical, radical)
+                radical_to_kanji[normalized_radical].append(kanji)
+                
+                # Debug spirit radical normalization
+                if DEBUG and radical in ["⺭", "礻"]:
+                    print(f"    🔧 Normalized '{radical}' → '{normalized_radical}' for kanji '{kanji}'")
         
         print(f"  📊 Built mapping for {len(radical_to_kanji)} unique radicals from kradfile")
         
         # Check 人 radical from kradfile inversion
-        if '人' in radical_to_kanji:
-            person_kanji_from_krad = radical_to_kanji['人']
-            has_fire = '火' in person_kanji_from_krad
-            print(f"  🎯 人 radical from kradfile inversion: {len(person_kanji_from_krad)} kanji, contains 火: {has_fire}")
-        else:
-            print("  ❌ 人 radical not found in kradfile inversion!")
+        if DEBUG:
+            if '人' in radical_to_kanji:
+                person_kanji_from_krad = radical_to_kanji['人']
+                has_fire = '火' in person_kanji_from_krad
+                print(f"  🎯 人 radical from kradfile inversion: {len(person_kanji_from_krad)} kanji, contains 火: {has_fire}")
+            else:
+                print("  ❌ 人 radical not found in kradfile inversion!")
         
         # Get stroke counts from radkfile if available
         radical_stroke_counts = {}
@@ -1563,42 +1644,48 @@ class DatabaseBuilder:
                 normalized_radical = unicode_normalization.get(radical, radical)
                 radical_stroke_counts[normalized_radical] = stroke_count
         
-        # Insert or update radical mappings
-        for radical, kanji_list in radical_to_kanji.items():
-            # Get stroke count from radkfile, default to 1 if not found
-            stroke_count = radical_stroke_counts.get(radical, 1)
-            
-            # Convert list of kanji to comma-separated string
-            kanji_str = ", ".join(sorted(kanji_list))  # Sort for consistency
-            
-            cursor.execute("""
-                INSERT OR REPLACE INTO radical_kanji_mapping (radical, stroke_count, kanji_list)
-                VALUES (?, ?, ?)
-            """, (radical, stroke_count, kanji_str))
+        # Merge everything in Python first so the table is written exactly once.
+        # Stroke count comes from radkfile, defaulting to 1 if not found; kanji
+        # lists are already sorted.
+        rows = {
+            radical: (radical, radical_stroke_counts.get(radical, 1), ", ".join(kanji_list))
+            for radical, kanji_list in radical_to_kanji.items()
+        }
         
-        conn.commit()
         print(f"✅ Built radical mappings for {len(radical_to_kanji)} radicals from kradfile data")
         
-        # Add any radicals from radkfile that weren't in kradfile
         if radkfile_data:
+            # Add any radicals from radkfile that weren't in kradfile. Several
+            # radkfile variants can normalize to the same radical; the last one wins.
             radkfile_only_count = 0
             for radical, info in radkfile_data.items():
                 # Apply normalization to check if radical already exists after normalization
                 normalized_radical = unicode_normalization.get(radical, radical)
                 if normalized_radical not in radical_to_kanji:
+                    if normalized_radical not in rows:
+                        radkfile_only_count += 1
                     stroke_count = info.get('strokeCount', 0)
-                    kanji_list = info.get('kanji', [])
-                    kanji_str = ", ".join(kanji_list) if isinstance(kanji_list, list) else str(kanji_list)
-                    
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO radical_kanji_mapping (radical, stroke_count, kanji_list)
-                        VALUES (?, ?, ?)
-                    """, (normalized_radical, stroke_count, kanji_str))
-                    radkfile_only_count += 1
+                    kanji_str = ", ".join(info.get('kanji', []))
+                    rows[normalized_radical] = (normalized_radical, stroke_count, kanji_str)
             
             if radkfile_only_count > 0:
-                conn.commit()
                 print(f"✅ Added {radkfile_only_count} additional radicals from radkfile")
+            
+            # Enhanced radkfile kanji lists override whatever the inversion produced
+            # for radicals already present (matched on the raw radkfile key)
+            print("  🔧 Enhancing radicals with radkfile data...")
+            enhanced_count = 0
+            for radical, info in radkfile_data.items():
+                if info.get('kanji') and radical in rows:
+                    rows[radical] = (radical, rows[radical][1], ", ".join(info['kanji']))
+                    enhanced_count += 1
+            print(f"  ✅ Updated {enhanced_count} radicals with enhanced data")
+        
+        executemany_chunked(cursor, """
+            INSERT INTO radical_kanji_mapping (radical, stroke_count, kanji_list)
+            VALUES (?, ?, ?)
+        """, rows.values())
+        conn.commit()
 
     def populate_radical_kanji_mapping(self, conn: sqlite3.Connection, radkfile_data: Dict) -> None:
         """Populate radical_kanji_mapping table from radkfile data (legacy method)"""
@@ -1606,17 +1693,18 @@ class DatabaseBuilder:
         
         print("🔧 Populating radical kanji mapping...")
         
+        rows = []
         for radical, info in radkfile_data.items():
             stroke_count = info.get('strokeCount', 0)
-            kanji_list = info.get('kanji', [])
             
             # Convert list of kanji to comma-separated string
-            kanji_str = ", ".join(kanji_list) if isinstance(kanji_list, list) else str(kanji_list)
-            
-            cursor.execute("""
-                INSERT OR REPLACE INTO radical_kanji_mapping (radical, stroke_count, kanji_list)
-                VALUES (?, ?, ?)
-            """, (radical, stroke_count, kanji_str))
+            kanji_str = ", ".join(info.get('kanji', []))
+            rows.append((radical, stroke_count, kanji_str))
+        
+        cursor.executemany("""
+            INSERT INTO radical_kanji_mapping (radical, stroke_count, kanji_list)
+            VALUES (?, ?, ?)
+        """, rows)
         
         conn.commit()
         print(f"✅ Added {len(radkfile_data)} radical kanji mappings")
@@ -1634,18 +1722,8 @@ class DatabaseBuilder:
         if not decomposition:
             return []
 
-        # IDC (Ideographic Description Characters) to ignore
-        idc_chars = {
-            '⿰', '⿱', '⿲', '⿳', '⿴', '⿵', '⿶', '⿷', '⿸', '⿹', '⿺', '⿻'
-        }
-
-        # Extract all characters except IDC symbols
-        components = []
-        for char in decomposition:
-            if char not in idc_chars and char.strip():
-                components.append(char)
-
-        return components
+        # Extract all characters except IDC symbols and whitespace
+        return list(decomposition.translate(IDC_DELETE_TABLE))
 
     def load_makemeahanzi_decomposition_data(self, makemeahanzi_path: str = None) -> Dict[str, List[str]]:
         """
@@ -1659,54 +1737,45 @@ class DatabaseBuilder:
         """
         print("📖 Loading makemeahanzi decomposition data...")
         
-        # If no path provided, try to download makemeahanzi data
-        temp_dir = None
-        if not makemeahanzi_path:
+        if makemeahanzi_path:
+            if not os.path.exists(makemeahanzi_path):
+                print(f"⚠️  Makemeahanzi file not found at {makemeahanzi_path}")
+                return {}
+            # Large read buffer; lines are parsed as bytes below
+            source = open(makemeahanzi_path, 'rb', buffering=1 << 20)
+        else:
+            # No path provided: download the archive into memory and read
+            # dictionary.txt straight out of it, without touching disk
             try:
-                # Try to use the same download logic from preserve_modifications.py
-                import tempfile
+                import io
                 import urllib.request
                 import zipfile
                 
-                temp_dir = tempfile.mkdtemp()
-                makemeahanzi_zip = os.path.join(temp_dir, "makemeahanzi.zip")
-                makemeahanzi_path = os.path.join(temp_dir, "dictionary.txt")
-                
                 print("⬇️  Downloading makemeahanzi data...")
-                urllib.request.urlretrieve(
-                    "https://github.com/skishore/makemeahanzi/archive/refs/heads/master.zip",
-                    makemeahanzi_zip
-                )
-                
-                with zipfile.ZipFile(makemeahanzi_zip, 'r') as zip_ref:
-                    zip_ref.extract("makemeahanzi-master/dictionary.txt", temp_dir)
-                    
-                # Move the extracted file to the expected location
-                extracted_path = os.path.join(temp_dir, "makemeahanzi-master", "dictionary.txt")
-                if os.path.exists(extracted_path):
-                    shutil.move(extracted_path, makemeahanzi_path)
+                with urllib.request.urlopen(
+                    "https://github.com/skishore/makemeahanzi/archive/refs/heads/master.zip"
+                ) as response:
+                    archive = zipfile.ZipFile(io.BytesIO(response.read()))
+                source = archive.open("makemeahanzi-master/dictionary.txt")
                 
-                print(f"✅ Downloaded makemeahanzi to {makemeahanzi_path}")
+                print("✅ Downloaded makemeahanzi data")
                 
             except Exception as e:
                 print(f"⚠️  Could not download makemeahanzi data: {e}")
                 return {}
         
-        if not os.path.exists(makemeahanzi_path):
-            print(f"⚠️  Makemeahanzi file not found at {makemeahanzi_path}")
-            return {}
-        
         radical_decompositions = {}
         
         try:
-            with open(makemeahanzi_path, 'r', encoding='utf-8') as f:
+            # NDJSON: parse each line's bytes directly
+            with source as f:
                 for line_num, line in enumerate(f, 1):
                     line = line.strip()
                     if not line:
                         continue
                     
                     try:
-                        entry = json.loads(line)
+                        entry = json_loads(line)
                         character = entry.get("character")
                         decomposition = entry.get("decomposition")
                         
@@ -1715,7 +1784,7 @@ class DatabaseBuilder:
                             if components and len(components) > 1:  # Only include composites
                                 radical_decompositions[character] = components
                     
-                    except json.JSONDecodeError:
+                    except ValueError:  # json and orjson decode errors are both ValueErrors
                         continue
                         
         except Exception as e:
@@ -1724,13 +1793,6 @@ class DatabaseBuilder:
         
         print(f"✅ Parsed {len(radical_decompositions)} radical decompositions from makemeahanzi")
         
-        # Clean up temporary files if we downloaded them
-        if temp_dir and os.path.exists(temp_dir):
-            try:
-                shutil.rmtree(temp_dir)
-            except:
-                pass
-        
         return radical_decompositions
 
     def populate_radical_decomposition_mapping(self, conn: sqlite3.Connection, decomposition_data: Dict[str, List[str]], existing_radicals: set) -> None:
@@ -1746,6 +1808,10 @@ class DatabaseBuilder:
         
         print("🔧 Populating radical decomposition mapping...")
         
+        # Membership is tested for every component, so make sure it's a hash lookup
+        if not isinstance(existing_radicals, (set, frozenset)):
+            existing_radicals = frozenset(existing_radicals)
+        
         
         # Chinese → Japanese radical substitutions
         chinese_to_japanese_substitutions = {
@@ -1773,52 +1839,64 @@ class DatabaseBuilder:
         }
         
         # Apply manual corrections first
-        corrected_count = 0
+        manual_correction_rows = []
         for radical, components in manual_corrections.items():
             if radical in existing_radicals:
                 valid_components = [comp for comp in components if comp in existing_radicals]
                 if valid_components and len(valid_components) > 1:
-                    components_str = ",".join(valid_components)
-                    component_count = len(valid_components)
-                    
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO radical_decomposition_mapping (radical, components, component_count)
-                        VALUES (?, ?, ?)
-                    """, (radical, components_str, component_count))
-                    
-                    corrected_count += 1
+                    manual_correction_rows.append((radical, ",".join(valid_components), len(valid_components)))
                     print(f"    🔧 Manual correction: {radical} → {valid_components}")
+        corrected_count = len(manual_correction_rows)
         
-        def apply_substitutions_and_expansion(components):
-            """Apply Chinese→Japanese substitutions and recursive expansion"""
-            expanded_components = []
-            
-            for comp in components:
-                # Apply Chinese → Japanese substitutions first
-                if comp in chinese_to_japanese_substitutions:
-                    substitute = chinese_to_japanese_substitutions[comp]
-                    expanded_components.append(substitute)
+        # Expansion of a single component only depends on the component, and the
+        # same sub-components recur across many radicals, so compute each once.
+        # The debug output is printed the first time a component is expanded.
+        component_expansions = {}
+
+        def expand_component(comp, visiting):
+            """Expand one component: substitution, recursive decomposition, or as-is"""
+            expansion = component_expansions.get(comp)
+            if expansion is not None:
+                return expansion
+
+            # Apply Chinese → Japanese substitutions first
+            if comp in chinese_to_japanese_substitutions:
+                substitute = chinese_to_japanese_substitutions[comp]
+                expansion = [substitute]
+                if DEBUG:
                     print(f"      🔄 Substituted: {comp} → {substitute}")
-                # Recursive expansion for missing components that have decompositions
-                elif comp not in existing_radicals and comp in decomposition_data:
-                    # Recursively expand missing component
-                    sub_components = decomposition_data[comp]
-                    # Apply substitutions recursively (but avoid infinite loops)
-                    if comp != '仌':  # Prevent infinite recursion for ice radical
-                        recursive_expansion = apply_substitutions_and_expansion(sub_components)
-                        expanded_components.extend(recursive_expansion)
-                        print(f"      🔄 Expanded: {comp} → {recursive_expansion}")
-                    else:
-                        # Special case for ice radical: 仌 → ['人', '人']
-                        expanded_components.extend(['人', '人'])
+            # Recursive expansion for missing components that have decompositions.
+            # Components already on the current expansion path are kept as-is so
+            # cyclic decompositions can't recurse forever.
+            elif comp not in existing_radicals and comp in decomposition_data and comp not in visiting:
+                if comp == '仌':
+                    # Special case for ice radical: 仌 → ['人', '人']
+                    expansion = ['人', '人']
+                    if DEBUG:
                         print(f"      🔄 Expanded ice: {comp} → ['人', '人']")
                 else:
-                    # Keep component as-is
-                    expanded_components.append(comp)
-            
+                    expansion = apply_substitutions_and_expansion(decomposition_data[comp], visiting | {comp})
+                    if DEBUG:
+                        print(f"      🔄 Expanded: {comp} → {expansion}")
+            else:
+                # Keep component as-is
+                expansion = [comp]
+
+            component_expansions[comp] = expansion
+            return expansion
+
+        def apply_substitutions_and_expansion(components, visiting=frozenset()):
+            """Apply Chinese→Japanese substitutions and recursive expansion"""
+            expanded_components = []
+            for comp in components:
+                expanded_components.extend(expand_component(comp, visiting))
             return expanded_components
         
-        valid_decompositions = 0
+        # Allow single components for important hierarchical radicals, otherwise require 2+
+        important_single_decompositions = frozenset({'冂', '⺣'})  # Box and fire radical create useful hierarchical paths
+        
+        decomposition_rows = []
+        debug_entries = []
         substitution_count = 0
         for radical, components in decomposition_data.items():
             # Skip if we already applied a manual correction
@@ -1833,28 +1911,29 @@ class DatabaseBuilder:
                 # Filter to only include components that exist as radicals after expansion
                 valid_components = [comp for comp in expanded_components if comp in existing_radicals]
                 
-                # Allow single components for important hierarchical radicals, otherwise require 2+
-                important_single_decompositions = {'冂', '⺣'}  # Box and fire radical create useful hierarchical paths
                 min_components = 1 if radical in important_single_decompositions else 2
                 
                 if valid_components and len(valid_components) >= min_components:
-                    components_str = ",".join(valid_components)
-                    component_count = len(valid_components)
-                    
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO radical_decomposition_mapping (radical, components, component_count)
-                        VALUES (?, ?, ?)
-                    """, (radical, components_str, component_count))
-                    
-                    valid_decompositions += 1
+                    decomposition_rows.append((radical, ",".join(valid_components), len(valid_components)))
                     
                     # Track substitutions made
                     if len(expanded_components) != len(components):
                         substitution_count += 1
                     
                     # Debug specific examples
-                    if radical in ['魚', '肉', '鳥', '馬', '丷'] or len(expanded_components) != len(components):
-                        print(f"    🎯 Added decomposition: {radical} → {valid_components} (from {components})")
+                    if DEBUG and (radical in ['魚', '肉', '鳥', '馬', '丷'] or len(expanded_components) != len(components)):
+                        debug_entries.append((radical, valid_components, components))
+        valid_decompositions = len(decomposition_rows)
+        
+        # Manual corrections are skipped in the makemeahanzi loop, so the two row
+        # sets never share a radical and can go in together
+        executemany_chunked(cursor, """
+            INSERT INTO radical_decomposition_mapping (radical, components, component_count)
+            VALUES (?, ?, ?)
+        """, manual_correction_rows + decomposition_rows)
+        
+        for radical, valid_components, components in debug_entries:
+            print(f"    🎯 Added decomposition: {radical} → {valid_components} (from {components})")
         
         # Add custom radical decompositions for Unicode variants
         custom_decompositions = {
@@ -1897,8 +1976,8 @@ class DatabaseBuilder:
 
         if os.path.exists(file_path):
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                with open(file_path, 'rb') as f:
+                    data = json_loads(f.read())
                 
                 # Extract characters array from KanjiDic JSON structure
                 characters = data.get('characters', [])
@@ -1912,139 +1991,149 @@ class DatabaseBuilder:
             print("Please ensure you have kanjidic.json file in the assets directory")
             return []
 
+    def _kanji_entry_row(self, entry: Dict) -> Optional[Tuple]:
+        """Build the kanji_entries row for a KanjiDic entry, or None if it has no kanji"""
+        # KanjiDic2 format uses 'literal' for the kanji character
+        kanji = first_present(entry, 'literal', 'kanji', 'character', default='')
+        if not kanji:
+            return None
+
+        # Extract meanings and readings from KanjiDic2 structure in one pass over the groups
+        meanings = []
+        kun_readings = []
+        on_readings = []
+        nanori_readings = []
+
+        reading_meaning = entry.get('readingMeaning', {})
+        for group in reading_meaning.get('groups', ()):
+            for meaning in group.get('meanings', ()):
+                if meaning.get('lang') == 'en':
+                    meanings.append(meaning['value'])
+
+            for reading in group.get('readings', ()):
+                reading_type = reading.get('type', '')
+                if reading_type == 'ja_kun':
+                    kun_readings.append(reading.get('value', ''))
+                elif reading_type == 'ja_on':
+                    on_readings.append(reading.get('value', ''))
+
+        if not meanings and 'meanings' in entry: # Fallback for older formats
+            meanings = entry['meanings']
+
+        meanings_json = json_dumps_list(meanings)
+
+        # Get nanori readings
+        if 'nanori' in reading_meaning:
+            nanori_readings = reading_meaning['nanori']
+
+        # Fallback to old format (if 'groups' not used or empty)
+        if not kun_readings and entry.get('kun_readings'):
+            kun_readings = entry['kun_readings']
+        if not on_readings and entry.get('on_readings'):
+            on_readings = entry['on_readings']
+        if not nanori_readings and entry.get('nanori_readings'):
+            nanori_readings = entry['nanori_readings']
+
+        kun_json = json_dumps_list(kun_readings)
+        on_json = json_dumps_list(on_readings)
+        nanori_json = json_dumps_list(nanori_readings)
+
+        # Extract metadata from KanjiDic2 structure
+        # Older flat formats carry these at the top level; only look there if misc has nothing
+        misc = entry.get('misc') or {}
+        jlpt_level = misc.get('jlptLevel')
+        if jlpt_level is None:
+            jlpt_level = first_present(entry, 'jlpt_level', 'jlpt')
+        grade = misc.get('grade')
+        if grade is None:
+            grade = first_present(entry, 'grade', 'grade_level')
+        stroke_counts = misc.get('strokeCounts')
+        stroke_count = stroke_counts[0] if stroke_counts else first_present(entry, 'stroke_count', 'strokes')
+        frequency = misc.get('frequency')
+        if frequency is None:
+            frequency = first_present(entry, 'frequency', 'freq')
+
+        heisig_number = first_present(entry, 'heisig_number', 'heisig')
+        heisig_keyword = entry.get('heisig_keyword', '')
+
+        # Extract radical information from the radicals array
+        radicals_list = entry.get('radicals', [])
+        radical_number = None
+        radical = ''
+        
+        # Find the classical radical
+        for rad in radicals_list:
+            if rad.get('type') == 'classical':
+                radical_number = rad.get('value')
+                break
+        
+        # Get radical name using a lookup table
+        radical_names_json = EMPTY_JSON_LIST
+        if radical_number:
+            radical_name = get_radical_name(radical_number)
+            if radical_name:
+                radical_names_json = RADICAL_NAMES_JSON[radical_number]
+                radical = radical_name
+
+        components_json = json_dumps_list(entry.get('components', []))
+
+        return (kanji, jlpt_level, grade, stroke_count, frequency,
+                meanings_json, kun_json, on_json, nanori_json,
+                radical_names_json, heisig_number, heisig_keyword,
+                components_json, radical, radical_number)
+
     def populate_kanji_entries(self, conn: sqlite3.Connection, kanjidic_data: List[Dict], debug_mode: bool = False) -> None:
-        """Populate the kanji_entries table"""
+        """Populate the (empty) kanji_entries table"""
         cursor = conn.cursor()
 
         print(f"📝 Populating kanji entries... (debug_mode={debug_mode})")
-        entries_added = 0
 
+        rows = []
         for i, entry in enumerate(kanjidic_data):
             if i % 50 == 0 and i > 0:
                 print(f"   Progress: {i}/{len(kanjidic_data)} kanji...")
-                conn.commit()
-
-            # KanjiDic2 format uses 'literal' for the kanji character
-            kanji = entry.get('literal', entry.get('kanji', entry.get('character', '')))
-            if not kanji:
-                continue
-
-            # Extract meanings from KanjiDic2 structure
-            meanings = []
-            reading_meaning = entry.get('readingMeaning', {})
-            if 'groups' in reading_meaning:
-                for group in reading_meaning['groups']:
-                    if 'meanings' in group:
-                        for meaning in group['meanings']:
-                            if meaning.get('lang') == 'en':
-                                meanings.append(meaning['value'])
-
-            if not meanings and 'meanings' in entry: # Fallback for older formats
-                meanings = entry['meanings']
-
-            meanings_json = json.dumps(meanings, ensure_ascii=False)
-
-            # Extract readings from KanjiDic2 structure
-            kun_readings = []
-            on_readings = []
-            nanori_readings = []
-
-            if 'groups' in reading_meaning:
-                for group in reading_meaning['groups']:
-                    if 'readings' in group:
-                        for reading in group['readings']:
-                            reading_type = reading.get('type', '')
-                            reading_value = reading.get('value', '')
-
-                            if reading_type == 'ja_kun':
-                                kun_readings.append(reading_value)
-                            elif reading_type == 'ja_on':
-                                on_readings.append(reading_value)
-
-            # Get nanori readings
-            if 'nanori' in reading_meaning:
-                nanori_readings = reading_meaning['nanori']
-
-            # Fallback to old format (if 'groups' not used or empty)
-            if not kun_readings and entry.get('kun_readings'):
-                kun_readings = entry['kun_readings']
-            if not on_readings and entry.get('on_readings'):
-                on_readings = entry['on_readings']
-            if not nanori_readings and entry.get('nanori_readings'):
-                nanori_readings = entry['nanori_readings']
-
-            kun_json = json.dumps(kun_readings if isinstance(kun_readings, list) else [kun_readings], ensure_ascii=False)
-            on_json = json.dumps(on_readings if isinstance(on_readings, list) else [on_readings], ensure_ascii=False)
-            nanori_json = json.dumps(nanori_readings if isinstance(nanori_readings, list) else [nanori_readings], ensure_ascii=False)
-
-            # Extract metadata from KanjiDic2 structure
-            misc = entry.get('misc', {})
-            jlpt_level = misc.get('jlptLevel', entry.get('jlpt_level', entry.get('jlpt')))
-            grade = misc.get('grade', entry.get('grade', entry.get('grade_level')))
-            stroke_counts = misc.get('strokeCounts', [])
-            stroke_count = stroke_counts[0] if stroke_counts else entry.get('stroke_count', entry.get('strokes'))
-            frequency = misc.get('frequency', entry.get('frequency', entry.get('freq')))
-
-            heisig_number = entry.get('heisig_number', entry.get('heisig'))
-            heisig_keyword = entry.get('heisig_keyword', '')
-
-            # Extract radical information from the radicals array
-            radicals_list = entry.get('radicals', [])
-            radical_number = None
-            radical = ''
-            
-            # Find the classical radical
-            for rad in radicals_list:
-                if rad.get('type') == 'classical':
-                    radical_number = rad.get('value')
-                    break
-            
-            # Get radical name using a lookup table
-            radical_names = []
-            if radical_number:
-                radical_name = get_radical_name(radical_number)
-                if radical_name:
-                    radical_names = [radical_name]
-                    radical = radical_name
-            
-            radical_names_json = json.dumps(radical_names, ensure_ascii=False)
+            row = self._kanji_entry_row(entry)
+            if row is not None:
+                rows.append(row)
+
+        insert_sql = """
+            INSERT INTO kanji_entries
+            (kanji, jlpt_level, grade, stroke_count, frequency,
+             meanings, kun_readings, on_readings, nanori_readings,
+             radical_names, heisig_number, heisig_keyword,
+             components, radical, radical_number)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """
 
-            components = entry.get('components', [])
-            components_json = json.dumps(components if isinstance(components, list) else [components], ensure_ascii=False)
+        # Load everything in one transaction; a commit per batch (or per row in
+        # debug mode) paid a journal sync each time for no benefit on a fresh build.
+        if conn.in_transaction:
+            conn.commit()
+        conn.execute("BEGIN")
 
-            try:
-                cursor.execute("""
-                    INSERT OR REPLACE INTO kanji_entries
-                    (kanji, jlpt_level, grade, stroke_count, frequency,
-                     meanings, kun_readings, on_readings, nanori_readings,
-                     radical_names, heisig_number, heisig_keyword,
-                     components, radical, radical_number)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (kanji, jlpt_level, grade, stroke_count, frequency,
-                      meanings_json, kun_json, on_json, nanori_json,
-                      radical_names_json, heisig_number, heisig_keyword,
-                      components_json, radical, radical_number))
-
-                entries_added += 1
-                
-                # In debug mode, commit after every successful insertion
-                if debug_mode:
-                    conn.commit()
-                    if entries_added % 100 == 0:
+        try:
+            executemany_chunked(cursor, insert_sql, rows)
+            entries_added = len(rows)
+        except sqlite3.Error as e:
+            # Fall back to row-by-row so one bad entry doesn't lose the rest,
+            # and so the offending kanji can be reported.
+            print(f"   ⚠️  Batch insert failed ({e}), retrying kanji one by one...")
+            conn.rollback()
+            conn.execute("BEGIN")
+            entries_added = 0
+            for row in rows:
+                try:
+                    cursor.execute(insert_sql, row)
+                    entries_added += 1
+                    if debug_mode and entries_added % 100 == 0:
                         print(f"   🐛 Debug: Successfully added {entries_added} kanji so far")
-                        
-            except sqlite3.Error as e:
-                print(f"   ❌ Error inserting kanji '{kanji}': {e}")
-                # Only suppress UNIQUE constraint errors, not other issues
-                if "UNIQUE constraint failed" not in str(e):
-                    print(f"   🔍 Non-unique error for '{kanji}': {e}")
-                    # Try to commit what we have so far to avoid losing progress
-                    try:
-                        conn.commit()
-                        print(f"   💾 Committed {entries_added} entries so far due to error")
-                    except:
-                        pass
-                continue
+                except sqlite3.Error as e:
+                    # A failed statement is rolled back on its own; the transaction
+                    # and the rows inserted so far are kept.
+                    print(f"   ❌ Error inserting kanji '{row[0]}': {e}")
+                    # Only suppress UNIQUE constraint errors, not other issues
+                    if "UNIQUE constraint failed" not in str(e):
+                        print(f"   🔍 Non-unique error for '{row[0]}': {e}")
 
         # Final commit
         conn.commit()
@@ -2056,8 +2145,8 @@ class DatabaseBuilder:
 
         if os.path.exists(file_path):
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                with open(file_path, 'rb') as f:
+                    data = json_loads(f.read())
                 
                 # Handle new JMnedict format with metadata and words array
                 if isinstance(data, dict) and 'words' in data:
@@ -2080,6 +2169,23 @@ class DatabaseBuilder:
             return []
 
 
+    def verify_person_radical(self, cursor: sqlite3.Cursor, label: str) -> None:
+        """Print the stored 人 radical row and whether it lists 火 (debug builds only)"""
+        cursor.execute("SELECT stroke_count, kanji_list FROM radical_kanji_mapping WHERE radical = '人'")
+        result = cursor.fetchone()
+        if not result:
+            print(f"  ❌ {label} - 人 radical not found in database!")
+            return
+
+        strokes, kanji_list = result
+        kanji_array = kanji_list.split(', ') if kanji_list else []
+        has_fire = '火' in kanji_array
+        print(f"  🎯 {label} - 人 radical: {len(kanji_array)} kanji, {strokes} strokes, contains 火: {has_fire}")
+        if kanji_array:
+            print(f"  📝 First 5 kanji: {kanji_array[:5]}")
+        if has_fire:
+            print(f"  🔥 火 is at position {kanji_array.index('火') + 1}")
+
     def rebuild_kanji_only(self) -> bool:
         """Rebuild only the kanji_entries table in existing database"""
         print(f"🔄 Rebuilding kanji data in: {self.output_path}")
@@ -2131,11 +2237,38 @@ class DatabaseBuilder:
             print("🗑️  Removing existing database...")
             os.remove(self.output_path)
 
+        # The source files are independent of each other and of the database,
+        # so read and parse them in the background while the earlier stages
+        # write. All SQLite work stays on this thread. JMdict is not prefetched:
+        # populate_word_variants parses jmdict.json itself, and loading both at
+        # once would hold two full copies of it in memory without ijson.
+        loader_pool = ThreadPoolExecutor(max_workers=5, thread_name_prefix="loader")
+        tags_file_path = os.path.join(os.path.dirname(jmdict_path), "tags.json")
+        kradfile_future = loader_pool.submit(self.load_kradfile_data, kradfile_path)
+        radkfile_future = loader_pool.submit(self.load_radkfile_data, radkfile_path)
+        decomposition_future = loader_pool.submit(self.load_makemeahanzi_decomposition_data)
+        kanjidic_future = loader_pool.submit(self.load_kanjidic_data, kanjidic_path)
+        tags_future = loader_pool.submit(self.load_tags_data, tags_file_path)
+
+        conn = None
         try:
             # Create new database
             conn = sqlite3.connect(self.output_path)
-            conn.execute("PRAGMA journal_mode = WAL;") # Enable WAL for better concurrency
-            conn.execute("PRAGMA synchronous = NORMAL;") # Optimize write performance
+            cursor = conn.cursor()
+            # Bulk-load settings for the whole pipeline: the file was just created
+            # and is rebuilt from the JSON sources, so a crash mid-build only means
+            # re-running it. Durable settings are restored at the end.
+            # The journal stays in memory rather than OFF because the kanji
+            # insert fallback relies on ROLLBACK. page_size is left at the default
+            # since the file ships to devices as-is.
+            conn.executescript("""
+                PRAGMA synchronous = OFF;
+                PRAGMA journal_mode = MEMORY;
+                PRAGMA temp_store = MEMORY;
+                PRAGMA cache_size = -262144;  -- 256 MiB page cache
+                PRAGMA locking_mode = EXCLUSIVE;
+                PRAGMA mmap_size = 268435456;
+            """)
 
             # Create schema
             print("📋 Creating database schema...")
@@ -2160,7 +2293,7 @@ class DatabaseBuilder:
             
             # Load and populate kradfile data (kanji → components)
             print("\n🔄 Processing kradfile data...")
-            kradfile_data = self.load_kradfile_data(kradfile_path)
+            kradfile_data = kradfile_future.result()
             if kradfile_data:
                 print(f"📊 Loaded {len(kradfile_data)} kanji entries from kradfile")
                 self.populate_kanji_radical_mapping(conn, kradfile_data)
@@ -2169,24 +2302,24 @@ class DatabaseBuilder:
             
             # Load radkfile data (for stroke counts and additional radicals)
             print("\n🔄 Loading radkfile data...")
-            radkfile_data = self.load_radkfile_data(radkfile_path)
+            radkfile_data = radkfile_future.result()
             if radkfile_data:
                 print(f"📊 Loaded {len(radkfile_data)} radicals from radkfile")
                 
-                # Show sample radical data for debugging
-                sample_radicals = list(radkfile_data.keys())[:5]
-                for radical in sample_radicals:
-                    kanji_count = len(radkfile_data[radical].get('kanji', []))
-                    stroke_count = radkfile_data[radical].get('strokeCount', 0)
-                    print(f"  🔍 {radical}: {kanji_count} kanji, {stroke_count} strokes")
-                
-                # Check specifically for 人 radical
-                if '人' in radkfile_data:
-                    person_kanji = radkfile_data['人']['kanji']
-                    has_fire = '火' in person_kanji
-                    print(f"  🎯 人 radical: {len(person_kanji)} kanji, contains 火: {has_fire}")
-                else:
-                    print("  ❌ 人 radical not found in radkfile!")
+                if DEBUG:
+                    # Show sample radical data for debugging
+                    for radical in itertools.islice(radkfile_data, 5):
+                        kanji_count = len(radkfile_data[radical].get('kanji', []))
+                        stroke_count = radkfile_data[radical].get('strokeCount', 0)
+                        print(f"  🔍 {radical}: {kanji_count} kanji, {stroke_count} strokes")
+                    
+                    # Check specifically for 人 radical
+                    if '人' in radkfile_data:
+                        person_kanji = radkfile_data['人']['kanji']
+                        has_fire = '火' in person_kanji
+                        print(f"  🎯 人 radical: {len(person_kanji)} kanji, contains 火: {has_fire}")
+                    else:
+                        print("  ❌ 人 radical not found in radkfile!")
             else:
                 print("⚠️  No radkfile data found!")
 
@@ -2194,28 +2327,6 @@ class DatabaseBuilder:
             print("\n🔧 Building radical → kanji mapping...")
             if kradfile_data:
                 self.populate_radical_kanji_mapping_from_kradfile(conn, kradfile_data, radkfile_data)
-                
-                # Verify the database entries
-                print("\n🔍 Verifying radical database entries...")
-                cursor = conn.cursor()
-                cursor.execute("SELECT COUNT(*) FROM radical_kanji_mapping")
-                radical_count = cursor.fetchone()[0]
-                print(f"  📊 Total radicals in database: {radical_count}")
-                
-                # Check 人 radical specifically
-                cursor.execute("SELECT radical, stroke_count, kanji_list FROM radical_kanji_mapping WHERE radical = '人'")
-                person_result = cursor.fetchone()
-                if person_result:
-                    radical, strokes, kanji_list = person_result
-                    kanji_count = len(kanji_list.split(', ')) if kanji_list else 0
-                    has_fire = '火' in kanji_list if kanji_list else False
-                    print(f"  🎯 Database 人 radical: {kanji_count} kanji, {strokes} strokes, contains 火: {has_fire}")
-                    if has_fire:
-                        print("    ✅ SUCCESS: 火 found in 人 radical!")
-                    else:
-                        print("    ❌ ISSUE: 火 NOT found in 人 radical")
-                else:
-                    print("  ❌ 人 radical not found in database!")
                     
             elif radkfile_data:
                 # Fallback to old method if only radkfile is available
@@ -2223,73 +2334,15 @@ class DatabaseBuilder:
             else:
                 print("⚠️  No radical data found, skipping radical kanji mapping.")
             
-            # POST-PROCESSING: Override ALL radicals with enhanced radkfile data
-            if radkfile_data:
-                print("\n🔧 POST-PROCESSING: Enhancing ALL radicals with radkfile data...")
-                cursor = conn.cursor()
-                
-                updated_count = 0
-                for radical, info in radkfile_data.items():
-                    enhanced_kanji_list = info.get('kanji', [])
-                    if enhanced_kanji_list:  # Only update if there's data
-                        kanji_str = ", ".join(enhanced_kanji_list)
-                        
-                        # Debug 人 radical specifically
-                        if radical == '人':
-                            print(f"  🔍 Updating 人 radical with {len(enhanced_kanji_list)} kanji")
-                            print(f"  🔍 火 in list: {'火' in enhanced_kanji_list}")
-                            print(f"  🔍 First 10 kanji: {enhanced_kanji_list[:10]}")
-                        
-                        cursor.execute("""
-                            UPDATE radical_kanji_mapping 
-                            SET kanji_list = ?
-                            WHERE radical = ?
-                        """, (kanji_str, radical))
-                        
-                        if cursor.rowcount > 0:
-                            updated_count += 1
-                            if radical == '人':
-                                print(f"  ✅ Successfully updated 人 radical (rowcount={cursor.rowcount})")
-                
-                conn.commit()
-                print(f"  ✅ Updated {updated_count} radicals with enhanced data")
-                
-                # Verify 人 radical specifically
-                cursor.execute("SELECT radical, stroke_count, kanji_list FROM radical_kanji_mapping WHERE radical = '人'")
-                result = cursor.fetchone()
-                if result:
-                    radical, strokes, kanji_list = result
-                    kanji_count = len(kanji_list.split(', ')) if kanji_list else 0
-                    has_fire = '火' in kanji_list if kanji_list else False
-                    print(f"  🎯 人 radical after update: {kanji_count} kanji, contains 火: {has_fire}")
-                    if has_fire:
-                        print("    ✅ SUCCESS: 火 found in 人 radical!")
-                
-                print("  ✅ Post-processing complete!")
-                
-                # Final verification before moving on
-                print("\n🔍 FINAL VERIFICATION of radical data...")
-                cursor.execute("SELECT radical, stroke_count, kanji_list FROM radical_kanji_mapping WHERE radical = '人'")
-                final_result = cursor.fetchone()
-                if final_result:
-                    radical, strokes, kanji_list = final_result
-                    kanji_count = len(kanji_list.split(', ')) if kanji_list else 0
-                    has_fire = '火' in kanji_list if kanji_list else False
-                    print(f"  🎯 FINAL CHECK - 人 radical: {kanji_count} kanji, contains 火: {has_fire}")
-                    
-                    # Also check a few specific kanji
-                    if kanji_list:
-                        kanji_array = kanji_list.split(', ')
-                        print(f"  📝 First 5 kanji: {kanji_array[:5]}")
-                        if '火' in kanji_array:
-                            fire_index = kanji_array.index('火')
-                            print(f"  🔥 火 is at position {fire_index + 1}")
-                else:
-                    print("  ❌ 人 radical not found in final check!")
+            if DEBUG:
+                print("\n🔍 Verifying radical database entries...")
+                cursor.execute("SELECT COUNT(*) FROM radical_kanji_mapping")
+                print(f"  📊 Total radicals in database: {cursor.fetchone()[0]}")
+                self.verify_person_radical(cursor, "Database")
 
             # RADICAL DECOMPOSITION: Load and populate makemeahanzi decomposition data
             print("\n🧩 Processing radical decomposition data...")
-            decomposition_data = self.load_makemeahanzi_decomposition_data()
+            decomposition_data = decomposition_future.result()
             if decomposition_data:
                 # Get existing radicals from the database to filter valid decompositions
                 cursor.execute("SELECT radical FROM radical_kanji_mapping")
@@ -2311,7 +2364,7 @@ class DatabaseBuilder:
 
             # Load and populate KanjiDic data
             print("\n📖 Processing KanjiDic data...")
-            kanjidic_data = self.load_kanjidic_data(kanjidic_path)
+            kanjidic_data = kanjidic_future.result()
             if kanjidic_data:
                 print(f"📊 Loaded {len(kanjidic_data)} kanji from KanjiDic")
                 self.populate_kanji_entries(conn, kanjidic_data)
@@ -2332,25 +2385,20 @@ class DatabaseBuilder:
                 print("🚨 No JMdict data loaded. Cannot build dictionary.")
                 return False
 
-            print(f"📊 Loaded {len(jmdict_data)} entries from JMdict")
+            if isinstance(jmdict_data, list):
+                print(f"📊 Loaded {len(jmdict_data)} entries from JMdict")
 
             # Load JMDict specific tags data
-            tags_file_path = os.path.join(os.path.dirname(jmdict_path), "tags.json")
-            tags_data_jmdict = self.load_tags_data(tags_file_path)
+            tags_data_jmdict = tags_future.result()
 
             # Populate dictionary data with JMdict entries
             print("🔄 Populating JMdict entries...")
             self.populate_dictionary_entries(conn, jmdict_data, tags_data_jmdict)
 
-            # Load and populate KanjiDic data from single file
-            print("\n🈵 Processing KanjiDic data...")
-            kanjidic_data = self.load_kanjidic_data(kanjidic_path)
-            if kanjidic_data:
-                self.populate_kanji_entries(conn, kanjidic_data)
-            else:
-                print("⚠️  No KanjiDic data found, skipping kanji tables.")
+            # NOTE: kradfile, radkfile and KanjiDic processing already done at the beginning
 
-            # NOTE: kradfile and radkfile processing already done at the beginning with post-processing
+            # Build secondary indexes in one pass now that the tables are loaded
+            self.create_indexes(conn)
 
             # Populate FTS tables (after all data is inserted into main table)
             self.populate_fts_tables(conn)
@@ -2362,31 +2410,28 @@ class DatabaseBuilder:
             if not self.verify_database(conn):
                 return False
 
-            # Check 人 radical before optimization
-            print("\n🔍 Checking 人 radical BEFORE optimization...")
-            cursor = conn.cursor()
-            cursor.execute("SELECT radical, stroke_count, kanji_list FROM radical_kanji_mapping WHERE radical = '人'")
-            before_result = cursor.fetchone()
-            if before_result:
-                radical, strokes, kanji_list = before_result
-                kanji_count = len(kanji_list.split(', ')) if kanji_list else 0
-                has_fire = '火' in kanji_list if kanji_list else False
-                print(f"  🎯 BEFORE VACUUM - 人 radical: {kanji_count} kanji, contains 火: {has_fire}")
+            if DEBUG:
+                self.verify_person_radical(cursor, "BEFORE OPTIMIZE")
             
-            # Optimize database
+            # Optimize database. The file is built from scratch and indexes are
+            # created after the load, so it is already compact; only rewrite it
+            # if something actually left free pages behind.
             print("\n🔧 Optimizing database...")
-            conn.execute("VACUUM")
+            cursor.execute("PRAGMA freelist_count")
+            free_pages = cursor.fetchone()[0]
+            if free_pages:
+                print(f"  🧹 {free_pages} free pages, running VACUUM...")
+                conn.execute("VACUUM")
             conn.execute("ANALYZE")
             
-            # Check 人 radical after optimization
-            print("\n🔍 Checking 人 radical AFTER optimization...")
-            cursor.execute("SELECT radical, stroke_count, kanji_list FROM radical_kanji_mapping WHERE radical = '人'")
-            after_result = cursor.fetchone()
-            if after_result:
-                radical, strokes, kanji_list = after_result
-                kanji_count = len(kanji_list.split(', ')) if kanji_list else 0
-                has_fire = '火' in kanji_list if kanji_list else False
-                print(f"  🎯 AFTER VACUUM - 人 radical: {kanji_count} kanji, contains 火: {has_fire}")
+            if DEBUG:
+                self.verify_person_radical(cursor, "AFTER OPTIMIZE")
+
+            # Restore the settings the shipped database has always used
+            conn.execute("PRAGMA locking_mode = NORMAL;")
+            conn.execute("PRAGMA journal_mode = WAL;") # Enable WAL for better concurrency
+            conn.execute("PRAGMA synchronous = NORMAL;") # Optimize write performance
+            conn.execute("PRAGMA optimize;")
 
             conn.close()
 
@@ -2404,6 +2449,17 @@ class DatabaseBuilder:
             import traceback
             traceback.print_exc()
             return False
+        finally:
+            # Don't leave loaders running after an early return or failure
+            loader_pool.shutdown(wait=False, cancel_futures=True)
+            # The build holds locking_mode = EXCLUSIVE; hand the file lock back on
+            # early returns and failures too (the success path already closed it)
+            if conn is not None:
+                try:
+                    conn.execute("PRAGMA locking_mode = NORMAL;")
+                except sqlite3.Error:
+                    pass
+                conn.close()
 
 def main():
     """Main entry point"""
@@ -5,14 +5,23 @@ Check which kanji from kradfile.json are missing in kanjidic.json
 
 import json
 import sys
+from bisect import bisect_right
+from collections import defaultdict
 from pathlib import Path
 from typing import Set, List, Dict
 
+# Use orjson for parsing if available (much faster on the large dictionary files)
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 def load_kradfile(file_path: str) -> Set[str]:
     """Load kanji characters from kradfile.json"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(file_path, 'rb') as f:
+            data = json_loads(f.read())
         
         kanji_dict = data.get('kanji', {})
         kanji_set = set(kanji_dict.keys())
@@ -26,11 +35,17 @@ def load_kradfile(file_path: str) -> Set[str]:
 def load_kanjidic(file_path: str) -> Set[str]:
     """Load kanji characters from kanjidic.json"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(file_path, 'rb') as f:
+            data = json_loads(f.read())
         
         characters = data.get('characters', [])
-        kanji_set = {char.get('literal', '') for char in characters if char.get('literal')}
+        # One .get per entry, with the set's add method bound once
+        kanji_set = set()
+        add_kanji = kanji_set.add
+        for char in characters:
+            literal = char.get('literal')
+            if literal:
+                add_kanji(literal)
         print(f"✅ Loaded {len(kanji_set)} kanji from kanjidic.json")
         return kanji_set
     
@@ -38,44 +53,39 @@ def load_kanjidic(file_path: str) -> Set[str]:
         print(f"❌ Error loading kanjidic: {e}")
         return set()
 
+# Unicode blocks as (first, last, name), in report order
+CJK_BLOCKS = (
+    (0x3400, 0x4DBF, 'CJK Unified Ideographs Extension A'),
+    (0x4E00, 0x9FFF, 'CJK Unified Ideographs'),
+    (0x20000, 0x2A6DF, 'CJK Unified Ideographs Extension B'),
+    (0x2A700, 0x2B73F, 'CJK Unified Ideographs Extension C'),
+    (0x2B740, 0x2B81F, 'CJK Unified Ideographs Extension D'),
+    (0x2B820, 0x2CEAF, 'CJK Unified Ideographs Extension E'),
+    (0x2CEB0, 0x2EBEF, 'CJK Unified Ideographs Extension F'),
+    (0xF900, 0xFAFF, 'CJK Compatibility Ideographs'),
+)
+CATEGORY_ORDER = tuple(name for _, _, name in CJK_BLOCKS) + ('Other',)
+
+# Same blocks sorted by start code point, for bisect lookups
+CJK_BLOCKS_BY_START = sorted(CJK_BLOCKS)
+CJK_BLOCK_STARTS = [first for first, _, _ in CJK_BLOCKS_BY_START]
+
 def categorize_missing_kanji(missing_kanji: List[str]) -> Dict[str, List[str]]:
     """Categorize missing kanji by Unicode block"""
-    categories = {
-        'CJK Unified Ideographs Extension A': [],
-        'CJK Unified Ideographs': [],
-        'CJK Unified Ideographs Extension B': [],
-        'CJK Unified Ideographs Extension C': [],
-        'CJK Unified Ideographs Extension D': [],
-        'CJK Unified Ideographs Extension E': [],
-        'CJK Unified Ideographs Extension F': [],
-        'CJK Compatibility Ideographs': [],
-        'Other': []
-    }
+    categories = defaultdict(list)
     
     for kanji in missing_kanji:
         code_point = ord(kanji)
         
-        if 0x3400 <= code_point <= 0x4DBF:
-            categories['CJK Unified Ideographs Extension A'].append(kanji)
-        elif 0x4E00 <= code_point <= 0x9FFF:
-            categories['CJK Unified Ideographs'].append(kanji)
-        elif 0x20000 <= code_point <= 0x2A6DF:
-            categories['CJK Unified Ideographs Extension B'].append(kanji)
-        elif 0x2A700 <= code_point <= 0x2B73F:
-            categories['CJK Unified Ideographs Extension C'].append(kanji)
-        elif 0x2B740 <= code_point <= 0x2B81F:
-            categories['CJK Unified Ideographs Extension D'].append(kanji)
-        elif 0x2B820 <= code_point <= 0x2CEAF:
-            categories['CJK Unified Ideographs Extension E'].append(kanji)
-        elif 0x2CEB0 <= code_point <= 0x2EBEF:
-            categories['CJK Unified Ideographs Extension F'].append(kanji)
-        elif 0xF900 <= code_point <= 0xFAFF:
-            categories['CJK Compatibility Ideographs'].append(kanji)
+        # Last block starting at or before the code point, if it reaches that far
+        index = bisect_right(CJK_BLOCK_STARTS, code_point) - 1
+        if index >= 0 and code_point <= CJK_BLOCKS_BY_START[index][1]:
+            categories[CJK_BLOCKS_BY_START[index][2]].append(kanji)
         else:
             categories['Other'].append(kanji)
     
-    # Remove empty categories
-    return {k: v for k, v in categories.items() if v}
+    # Only non-empty categories exist; return them in report order
+    return {name: categories[name] for name in CATEGORY_ORDER if name in categories}
 
 def main():
     # Default paths
@@ -6,14 +6,43 @@ For example: 火 has 火 as one of its radicals
 
 import json
 import sys
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+# Use orjson for parsing if available (much faster on the large dictionary files)
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# Common basic radicals
+COMMON_RADICALS = frozenset({
+    '一', '｜', 'ノ', '丶', '乙', '亅', '二', '亠', '人', '⺅', '儿', '入', '八', 'ハ',
+    '冂', '冖', '冫', '几', '凵', '刀', '⺉', '力', '勹', '匕', '匚', '匸', '十', '卜',
+    '卩', '厂', '厶', '又', '口', '囗', '土', '士', '夂', '夊', '夕', '大', '女', '子',
+    '宀', '寸', '小', '⺌', '尢', '尸', '屮', '山', '巛', '川', '工', '已', '巾', '干',
+    '幺', '广', '廴', '廾', '弋', '弓', '彐', '彡', '彳', '心', '⺖', '戈', '戸', '手',
+    '支', '攵', '文', '斗', '斤', '方', '无', '日', '曰', '月', '木', '欠', '止', '歹',
+    '殳', '毋', '比', '毛', '氏', '气', '水', '⺡', '火', '⺣', '爪', '父', '爻', '爿',
+    '片', '牙', '牛', '犬', '⺨', '玄', '玉', '王', '瓜', '瓦', '甘', '生', '用', '田',
+    '疋', '⽧', '癶', '白', '皮', '皿', '目', '矛', '矢', '石', '示', '⺭', '禸', '禾',
+    '穴', '立', '竹', '米', '糸', '缶', '⺲', '羊', '羽', '⺹', '老', '而', '耒', '耳',
+    '聿', '肉', '月', '臣', '自', '至', '臼', '舌', '舛', '舟', '艮', '色', '⺾', '虍',
+    '虫', '血', '行', '衣', '⻂', '西', '見', '角', '言', '谷', '豆', '豕', '豸', '貝',
+    '赤', '走', '足', '身', '車', '辛', '⻌', '⻏', '酉', '釆', '里', '金', '長', '門',
+    '⻖', '隶', '隹', '雨', '青', '非', '面', '革', '韋', '韭', '音', '頁', '風', '飛',
+    '食', '首', '香', '馬', '骨', '高', '髟', '鬥', '鬯', '鬲', '鬼', '魚', '鳥', '鹵',
+    '鹿', '麦', '麻', '黄', '黍', '黒', '黹', '黽', '鼎', '鼓', '鼠', '鼻', '齊', '歯',
+    '龍', '龜', '龠'
+})
+
 def load_kradfile(file_path: str) -> Dict[str, List[str]]:
     """Load kanji-to-radicals mapping from kradfile.json"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(file_path, 'rb') as f:
+            data = json_loads(f.read())
         
         kanji_dict = data.get('kanji', {})
         print(f"✅ Loaded {len(kanji_dict)} kanji from kradfile.json")
@@ -25,13 +54,12 @@ def load_kradfile(file_path: str) -> Dict[str, List[str]]:
 
 def find_self_radicals(kanji_dict: Dict[str, List[str]]) -> List[Tuple[str, List[str]]]:
     """Find kanji that contain themselves as a radical"""
-    self_radicals = []
-    
-    for kanji, radicals in kanji_dict.items():
-        if kanji in radicals:
-            self_radicals.append((kanji, radicals))
+    # Radical lists are only a handful long, so a list scan beats building a set
+    self_radicals = [(kanji, radicals) for kanji, radicals in kanji_dict.items() if kanji in radicals]
     
-    return sorted(self_radicals)
+    # Kanji are unique keys, so sorting on them alone gives the same order
+    self_radicals.sort(key=itemgetter(0))
+    return self_radicals
 
 def categorize_by_radical_count(self_radicals: List[Tuple[str, List[str]]]) -> Dict[int, List[Tuple[str, List[str]]]]:
     """Categorize kanji by the number of radicals they have"""
@@ -45,10 +73,6 @@ def categorize_by_radical_count(self_radicals: List[Tuple[str, List[str]]]) -> D
     
     return categories
 
-def is_basic_radical(kanji: str, common_radicals: set) -> bool:
-    """Check if the kanji is a common basic radical"""
-    return kanji in common_radicals
-
 def main():
     # Default path
     kradfile_path = "app/src/main/assets/kradfile.json"
@@ -74,27 +98,6 @@ def main():
     print(f"📊 Found {len(self_radicals)} kanji that contain themselves as a radical")
     print()
     
-    # Define common basic radicals
-    common_radicals = {
-        '一', '｜', 'ノ', '丶', '乙', '亅', '二', '亠', '人', '⺅', '儿', '入', '八', 'ハ',
-        '冂', '冖', '冫', '几', '凵', '刀', '⺉', '力', '勹', '匕', '匚', '匸', '十', '卜',
-        '卩', '厂', '厶', '又', '口', '囗', '土', '士', '夂', '夊', '夕', '大', '女', '子',
-        '宀', '寸', '小', '⺌', '尢', '尸', '屮', '山', '巛', '川', '工', '已', '巾', '干',
-        '幺', '广', '廴', '廾', '弋', '弓', '彐', '彡', '彳', '心', '⺖', '戈', '戸', '手',
-        '支', '攵', '文', '斗', '斤', '方', '无', '日', '曰', '月', '木', '欠', '止', '歹',
-        '殳', '毋', '比', '毛', '氏', '气', '水', '⺡', '火', '⺣', '爪', '父', '爻', '爿',
-        '片', '牙', '牛', '犬', '⺨', '玄', '玉', '王', '瓜', '瓦', '甘', '生', '用', '田',
-        '疋', '⽧', '癶', '白', '皮', '皿', '目', '矛', '矢', '石', '示', '⺭', '禸', '禾',
-        '穴', '立', '竹', '米', '糸', '缶', '⺲', '羊', '羽', '⺹', '老', '而', '耒', '耳',
-        '聿', '肉', '月', '臣', '自', '至', '臼', '舌', '舛', '舟', '艮', '色', '⺾', '虍',
-        '虫', '血', '行', '衣', '⻂', '西', '見', '角', '言', '谷', '豆', '豕', '豸', '貝',
-        '赤', '走', '足', '身', '車', '辛', '⻌', '⻏', '酉', '釆', '里', '金', '長', '門',
-        '⻖', '隶', '隹', '雨', '青', '非', '面', '革', '韋', '韭', '音', '頁', '風', '飛',
-        '食', '首', '香', '馬', '骨', '高', '髟', '鬥', '鬯', '鬲', '鬼', '魚', '鳥', '鹵',
-        '鹿', '麦', '麻', '黄', '黍', '黒', '黹', '黽', '鼎', '鼓', '鼠', '鼻', '齊', '歯',
-        '龍', '龜', '龠'
-    }
-    
     # Categorize by radical count
     categories = categorize_by_radical_count(self_radicals)
     
@@ -108,10 +111,7 @@ def main():
         complex = []
         
         for kanji, radicals in entries:
-            if is_basic_radical(kanji, common_radicals):
-                basic.append((kanji, radicals))
-            else:
-                complex.append((kanji, radicals))
+            (basic if kanji in COMMON_RADICALS else complex).append((kanji, radicals))
         
         # Show basic radicals first
         if basic:
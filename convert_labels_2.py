@@ -18,26 +18,27 @@ def convert_labels():
         print(f"Error: {input_file} not found!")
         return False
     
-    # Convert each character to a list element
-    kanji_list = []
-    for char in content:
-        # Skip whitespace characters (newlines, spaces, etc.)
-        if char.strip():
-            kanji_list.append(f"'{char}'")
+    # Drop whitespace (newlines, spaces, etc.) in one pass; every remaining
+    # character is one kanji label
+    kanji_chars = ''.join(content.split())
     
-    print(f"Found {len(kanji_list)} kanji characters")
-    print(f"First 20 kanji: {kanji_list[:20]}")
-    print(f"Last 20 kanji: {kanji_list[-20:]}")
+    print(f"Found {len(kanji_chars)} kanji characters")
+    print(f"First 20 kanji: {list(kanji_chars[:20])}")
+    print(f"Last 20 kanji: {list(kanji_chars[-20:])}")
     
     # Create Python list format
-    python_list_content = '[' + ', '.join(kanji_list) + ']'
+    if kanji_chars:
+        python_list_content = "['" + "', '".join(kanji_chars) + "']"
+    else:
+        python_list_content = '[]'
     
     # Write to output file
     print(f"Writing Python list format to: {output_file}")
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(python_list_content)
+    # Encode once and write the bytes in a single call
+    with open(output_file, 'wb') as f:
+        f.write(python_list_content.encode('utf-8'))
     
-    print(f"Successfully converted {len(kanji_list)} kanji to Python list format!")
+    print(f"Successfully converted {len(kanji_chars)} kanji to Python list format!")
     print(f"Output file size: {len(python_list_content)} characters")
     
     return True
@@ -5,13 +5,91 @@ Downloads the latest jmdict-eng and kanjidic2-en files from jmdict-simplified re
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 import zipfile
 import json
+import hashlib
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import BinaryIO, Dict, Iterable, Optional, Tuple, Union
 import sys
 
+# Use orjson for parsing the API and Kradical responses if available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Both parsers accept the raw response bytes
+json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+def json_dumps_bytes(data, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, compact or with 2-space indent, with orjson if available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+# Use ijson to stream the Kradical arrays if available, one entry at a time
+# instead of holding the body, its decoded text and the parsed list at once
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+def _jmdict_edition(name: str) -> str:
+    """Tell the common-words-only JMdict release asset from the full one"""
+    return 'common' if 'common' in name else 'full'
+
+# Preference between editions of the same asset, higher wins: the common JMdict
+# is only used if no full version is found
+EDITION_PRIORITY = {
+    'common': 0,
+    'full': 1,
+}
+
+# Release assets to pick out of the jmdict-simplified release, checked in order:
+# (name substring, filename in assets or None to skip, label, edition function or None)
+RELEASE_ASSET_MATCHERS = (
+    ('jmdict-eng', 'jmdict.json', 'JMdict', _jmdict_edition),
+    ('kanjidic2-en', 'kanjidic.json', 'Kanjidic', None),
+    ('kradfile', None, 'Kradfile', None),
+)
+
+# Extracted JSON files are saved in assets under these names, first match wins
+ASSET_FILENAMES = (
+    ('jmdict-eng', 'jmdict.json'),
+    ('kanjidic2-en', 'kanjidic.json'),
+    ('kradfile', 'kradfile.json'),
+    ('radkfile', 'radkfile.json'),
+)
+
+# The raw JSON/text files compress around 10x; release ZIPs are already compressed
+RAW_FILE_HEADERS = {'Accept-Encoding': 'gzip'}
+
+# Streaming download buffer, and the minimum number of bytes between progress updates
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+PROGRESS_MIN_STEP = 1024 * 1024
+
+# How many times an interrupted download is resumed with a Range request before giving up
+DOWNLOAD_RESUME_ATTEMPTS = 3
+
+# A release ZIP that fails verification is downloaded this many times in total
+ZIP_DOWNLOAD_ATTEMPTS = 2
+
+# Release ZIPs up to this size are downloaded into memory; larger ones spill to a temp file
+ZIP_SPOOL_MAX_SIZE = 64 * 1024 * 1024
+
 class DictionaryDownloader:
     def __init__(self, base_dir: str = ".", assets_dir: str = None):
         self.base_dir = Path(base_dir)
@@ -32,6 +110,25 @@ class DictionaryDownloader:
         # GitHub API endpoint
         self.api_url = "https://api.github.com/repos/scriptin/jmdict-simplified/releases/latest"
         
+        # ETag / Last-Modified and release metadata from the previous run, so an
+        # unchanged release costs a 304 instead of a full API response
+        self.release_cache_path = self.downloads_dir / ".release_cache.json"
+        self.release_cache = self.load_release_cache()
+        self.release_cache_lock = threading.Lock()
+        
+        # Unmodified copies of the converted raw files, for the ETag check
+        self.raw_files_dir = self.downloads_dir / "raw_files"
+        
+        # One session for every request so keep-alive connections are reused,
+        # with a pool large enough for the parallel downloads. Transient server
+        # errors are retried with backoff instead of failing the whole update.
+        self.session = requests.Session()
+        retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=retries)
+        self.session.mount('https://', adapter)
+        # GitHub asks API clients to identify themselves
+        self.session.headers.update({'User-Agent': 'kanjireader-updater/1.0'})
+        
         # Direct URL for complete radkfile from Kradical repository
         self.kradical_radkfile_url = "https://raw.githubusercontent.com/tim-harding/Kradical/master/assets/outputs/radk.json"
         
@@ -44,17 +141,86 @@ class DictionaryDownloader:
         # Direct URL for pitch accent data from Kanjium repository
         self.kanjium_accents_url = "https://raw.githubusercontent.com/mifunetoshiro/kanjium/master/data/source_files/raw/accents.txt"
     
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Close the HTTP session and its pooled connections"""
+        self.session.close()
+    
+    def load_release_cache(self) -> Dict:
+        """Load the cached release validators and metadata, or an empty cache"""
+        try:
+            with open(self.release_cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            return cache if isinstance(cache, dict) else {}
+        except (OSError, json.JSONDecodeError):
+            return {}
+    
+    def save_release_cache(self):
+        """Write the release cache back to the downloads directory (call with release_cache_lock held)"""
+        try:
+            with open(self.release_cache_path, 'w', encoding='utf-8') as f:
+                json.dump(self.release_cache, f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            print(f"Warning: Could not save release cache: {e}")
+    
     def get_latest_release_info(self) -> Optional[Dict]:
         """Get information about the latest release from GitHub API"""
         try:
             print("Fetching latest release information...")
-            response = requests.get(self.api_url, timeout=30)
+            
+            # Conditional request: a 304 carries no body and does not use up
+            # the unauthenticated rate limit. Otherwise ask for the versioned,
+            # gzip-compressed JSON representation.
+            headers = {
+                'Accept': 'application/vnd.github+json',
+                'Accept-Encoding': 'gzip',
+                'X-GitHub-Api-Version': '2022-11-28',
+            }
+            with self.release_cache_lock:
+                cached_release = self.release_cache.get('release')
+                if cached_release:
+                    if self.release_cache.get('etag'):
+                        headers['If-None-Match'] = self.release_cache['etag']
+                    if self.release_cache.get('last_modified'):
+                        headers['If-Modified-Since'] = self.release_cache['last_modified']
+            
+            response = self.session.get(self.api_url, headers=headers, timeout=30)
+            
+            if response.status_code == 304 and cached_release:
+                print(f"Latest release: {cached_release['tag_name']} (unchanged since last check)")
+                print(f"Published: {cached_release['published_at']}")
+                return cached_release
+            
             response.raise_for_status()
             
-            release_data = response.json()
+            release_data = json_loads(response.content)
             print(f"Latest release: {release_data['tag_name']}")
             print(f"Published: {release_data['published_at']}")
             
+            # Only the fields the downloader reads are kept
+            with self.release_cache_lock:
+                self.release_cache['etag'] = response.headers.get('ETag')
+                self.release_cache['last_modified'] = response.headers.get('Last-Modified')
+                self.release_cache['release'] = {
+                    'tag_name': release_data['tag_name'],
+                    'published_at': release_data['published_at'],
+                    'assets': [
+                        {
+                            'name': asset['name'],
+                            'browser_download_url': asset['browser_download_url'],
+                            'id': asset.get('id'),
+                            'updated_at': asset.get('updated_at'),
+                        }
+                        for asset in release_data.get('assets', [])
+                    ],
+                }
+                self.save_release_cache()
+            
             return release_data
             
         except requests.RequestException as e:
@@ -64,37 +230,87 @@ class DictionaryDownloader:
             print(f"Error parsing release JSON: {e}")
             return None
     
+    def get_if_changed(self, url: str, output_path: Path, timeout: int, stream: bool = False):
+        """GET a raw file, or return None if it hasn't changed since it was saved to output_path
+
+        Later update steps rewrite some of these files in place (preserve_modifications.py
+        merges into kradfile.json and radkfile.json), so the ETag is checked against
+        the unmodified copy kept in raw_files_dir. On a 304 that copy is restored
+        to output_path, as if the file had just been downloaded and converted.
+        """
+        with self.release_cache_lock:
+            cached = dict(self.release_cache.get('raw_files', {}).get(url) or {})
+        saved_copy = self.raw_files_dir / output_path.name
+        headers = dict(RAW_FILE_HEADERS)
+        if cached.get('etag') and self.is_extracted_file_unchanged(cached, saved_copy):
+            headers['If-None-Match'] = cached['etag']
+        
+        response = self.session.get(url, timeout=timeout, headers=headers, stream=stream)
+        if response.status_code == 304 and 'If-None-Match' in headers:
+            # A streamed response holds its pooled connection until closed
+            response.close()
+            shutil.copyfile(saved_copy, output_path)
+            return None
+        response.raise_for_status()
+        return response
+    
+    def record_raw_file(self, url: str, response, output_path: Path):
+        """Remember the ETag of a raw file and keep an unmodified copy of the file it was saved to"""
+        etag = response.headers.get('ETag')
+        if not etag:
+            return
+        self.raw_files_dir.mkdir(exist_ok=True)
+        saved_copy = self.raw_files_dir / output_path.name
+        shutil.copyfile(output_path, saved_copy)
+        stat = saved_copy.stat()
+        with self.release_cache_lock:
+            self.release_cache.setdefault('raw_files', {})[url] = {
+                'etag': etag, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns
+            }
+            self.save_release_cache()
+    
+    def iter_json_array(self, response):
+        """Yield the items of a JSON array response, streaming them with ijson if available"""
+        if IJSON_AVAILABLE:
+            # Let urllib3 undo any gzip transfer encoding before ijson reads the bytes
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, 'item')
+        else:
+            data = json_loads(response.content)
+            if not isinstance(data, list):
+                raise ValueError(f"expected a JSON array, got {type(data).__name__}")
+            yield from data
+    
     def download_kradical_radkfile(self) -> Optional[Path]:
         """Download radkfile directly from Kradical repository and convert format"""
         try:
             print("Downloading complete radkfile from Kradical repository...")
-            response = requests.get(self.kradical_radkfile_url, timeout=30)
-            response.raise_for_status()
-            
-            # Parse the Kradical format (array of objects)
-            kradical_data = response.json()
-            if not isinstance(kradical_data, list):
+            radkfile_path = self.assets_dir / "radkfile.json"
+            response = self.get_if_changed(self.kradical_radkfile_url, radkfile_path, 30, stream=IJSON_AVAILABLE)
+            if response is None:
+                print(f"✅ Radkfile unchanged since last download, keeping {radkfile_path}")
+                return radkfile_path
+            
+            # Parse the Kradical format (array of objects) and convert it to our
+            # expected format as it arrives, using the same logic as the provided code
+            by_stroke = {}
+            with response:
+                converted_data = self.convert_radicals_to_new_format(
+                    self.iter_json_array(response), "converted-from-kradical", by_stroke
+                )
+            if not converted_data['radicals']:
                 print("❌ Unexpected Kradical radkfile format")
                 return None
             
-            print(f"   Downloaded {len(kradical_data)} radical entries")
-            
-            # Convert to our expected format using the same logic as the provided code
-            converted_data = self.convert_radicals_to_new_format(kradical_data, "converted-from-kradical")
-            
             # Save converted data to assets directory as radkfile.json
-            radkfile_path = self.assets_dir / "radkfile.json"
-            with open(radkfile_path, 'w', encoding='utf-8') as f:
-                json.dump(converted_data, f, ensure_ascii=False, separators=(',', ':'))
+            radkfile_path.write_bytes(json_dumps_bytes(converted_data))
+            self.record_raw_file(self.kradical_radkfile_url, response, radkfile_path)
             
             print(f"✅ Downloaded and converted complete radkfile to {radkfile_path}")
             print(f"   Found {len(converted_data['radicals'])} radicals")
             
             # Check for 17-stroke radical
-            stroke_17_radicals = []
-            for radical, info in converted_data["radicals"].items():
-                if info["strokeCount"] == 17:
-                    stroke_17_radicals.append(radical)
+            stroke_17_radicals = by_stroke.get(17, [])
             
             if stroke_17_radicals:
                 print(f"   ✅ Includes 17-stroke radicals: {stroke_17_radicals}")
@@ -115,19 +331,19 @@ class DictionaryDownloader:
         """Download kradfile with proper Unicode radicals from Kradical repository"""
         try:
             print("Downloading kradfile from Kradical repository (proper Unicode radicals)...")
-            response = requests.get(self.kradical_kradfile_url, timeout=30)
-            response.raise_for_status()
-            
-            # Parse the JSON data directly
-            kradfile_data = response.json()
+            kradfile_path = self.assets_dir / "kradfile.json"
+            response = self.get_if_changed(self.kradical_kradfile_url, kradfile_path, 30, stream=IJSON_AVAILABLE)
+            if response is None:
+                print(f"✅ Kradfile unchanged since last download, keeping {kradfile_path}")
+                return kradfile_path
             
-            # Convert from Kradical's array format to our expected format
-            converted_data = self.convert_kradfile_to_expected_format(kradfile_data)
+            # Convert from Kradical's array format to our expected format while parsing
+            with response:
+                converted_data = self.convert_kradfile_to_expected_format(self.iter_json_array(response))
             
             # Save converted data to assets directory as kradfile.json
-            kradfile_path = self.assets_dir / "kradfile.json"
-            with open(kradfile_path, 'w', encoding='utf-8') as f:
-                json.dump(converted_data, f, ensure_ascii=False, indent=2)
+            kradfile_path.write_bytes(json_dumps_bytes(converted_data, indent=True))
+            self.record_raw_file(self.kradical_kradfile_url, response, kradfile_path)
             
             print(f"✅ Downloaded and converted Kradical kradfile to {kradfile_path}")
             print(f"   Found {len(converted_data['kanji'])} kanji entries")
@@ -154,7 +370,7 @@ class DictionaryDownloader:
         """Download comprehensive kradfile-u from kensaku repository for merging additional kanji"""
         try:
             print("Downloading additional kanji from kensaku repository...")
-            response = requests.get(self.kensaku_kradfile_url, timeout=30)
+            response = self.session.get(self.kensaku_kradfile_url, headers=RAW_FILE_HEADERS, timeout=30)
             response.raise_for_status()
             
             # Parse the kradfile-u format (text format, not JSON)
@@ -227,12 +443,12 @@ class DictionaryDownloader:
             "kanji": kanji_radicals
         }
     
-    def convert_kradfile_to_expected_format(self, input_data: list, version: str = "converted-from-kradical") -> dict:
+    def convert_kradfile_to_expected_format(self, input_data: Iterable[dict], version: str = "converted-from-kradical") -> dict:
         """
         Converts Kradical krad.json format to expected kradfile.json format.
         
         Args:
-            input_data (list): A list of dictionaries with 'kanji' and 'radicals' keys
+            input_data (iterable): Dictionaries with 'kanji' and 'radicals' keys
             version (str): The version string to be included in the output
         
         Returns:
@@ -252,15 +468,18 @@ class DictionaryDownloader:
         
         return converted_format
     
-    def convert_radicals_to_new_format(self, input_data: list, version: str = "3.6.1") -> dict:
+    def convert_radicals_to_new_format(self, input_data: Iterable[dict], version: str = "3.6.1",
+                                       by_stroke: Optional[Dict[int, list]] = None) -> dict:
         """
         Converts a list of radical dictionaries into a new, nested dictionary format.
         Based on the provided conversion code.
         
         Args:
-            input_data (list): A list of dictionaries, where each dictionary
+            input_data (iterable): Dictionaries, where each dictionary
                                represents a radical with keys 'radical', 'stroke', and 'kanji'.
             version (str): The version string to be included in the output.
+            by_stroke (dict, optional): If given, filled with stroke count -> list of
+                               radical characters while converting.
         
         Returns:
             dict: A dictionary in the new format with 'version' and 'radicals' keys.
@@ -276,6 +495,15 @@ class DictionaryDownloader:
             kanji_list = radical_entry.get("kanji", [])
             
             if radical_char:
+                if by_stroke is not None:
+                    previous = new_format["radicals"].get(radical_char)
+                    if previous is None:
+                        by_stroke.setdefault(stroke_count, []).append(radical_char)
+                    elif previous["strokeCount"] != stroke_count:
+                        # A repeated radical keeps only its last stroke count
+                        by_stroke[previous["strokeCount"]].remove(radical_char)
+                        by_stroke.setdefault(stroke_count, []).append(radical_char)
+                
                 # The 'code' field is set to null as per the desired output format
                 new_format["radicals"][radical_char] = {
                     "strokeCount": stroke_count,
@@ -289,13 +517,16 @@ class DictionaryDownloader:
         """Download pitch accent data from Kanjium repository"""
         try:
             print("Downloading pitch accent data from Kanjium repository...")
-            response = requests.get(self.kanjium_accents_url, timeout=60)  # Larger file needs more time
-            response.raise_for_status()
+            accents_path = self.assets_dir / "accents.txt"
+            response = self.get_if_changed(self.kanjium_accents_url, accents_path, 60)  # Larger file needs more time
+            if response is None:
+                print(f"✅ Pitch accent data unchanged since last download, keeping {accents_path}")
+                return accents_path
             
             # Save raw text file to assets directory as accents.txt
-            accents_path = self.assets_dir / "accents.txt"
             with open(accents_path, 'w', encoding='utf-8') as f:
                 f.write(response.text)
+            self.record_raw_file(self.kanjium_accents_url, response, accents_path)
             
             # Count lines for verification
             line_count = len(response.text.strip().split('\n'))
@@ -312,78 +543,200 @@ class DictionaryDownloader:
             print(f"❌ Error saving accent data: {e}")
             return None
     
-    def find_target_assets(self, release_data: Dict) -> Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]:
-        """Find the jmdict-eng and kanjidic2-en ZIP file URLs (kradfile from kensaku, radkfile from Kradical)"""
-        jmdict_url = None
-        kanjidic_url = None
-        kradfile_url = None  # Will be handled separately from kensaku repo
-        radkfile_url = None  # Will be handled separately from Kradical repo
+    def find_target_assets(self, release_data: Dict) -> Dict[str, Optional[Dict]]:
+        """Find the jmdict-eng and kanjidic2-en ZIP release assets (kradfile from kensaku, radkfile from Kradical)
+
+        Returns the release's asset dicts keyed by the filename they are saved
+        as in assets, so their id and updated_at can be compared with the
+        previous run.
+        """
+        found = {}  # proper filename -> (rank, asset)
         
         assets = release_data.get('assets', [])
         print(f"Found {len(assets)} assets in release")
         
         for asset in assets:
             name = asset['name']
-            download_url = asset['browser_download_url']
-            
-            # Look for jmdict-eng ZIP files (prefer full version over common)
-            if 'jmdict-eng' in name and name.endswith('.zip'):
-                # Prefer full version over common version
-                if 'common' not in name:
-                    jmdict_url = download_url
-                    print(f"Found JMdict file (full): {name}")
-                elif jmdict_url is None:  # Only use common if no full version found
-                    jmdict_url = download_url
-                    print(f"Found JMdict file (common): {name}")
-            
-            # Look for kanjidic2-en ZIP files  
-            elif 'kanjidic2-en' in name and name.endswith('.zip'):
-                kanjidic_url = download_url
-                print(f"Found Kanjidic file: {name}")
-            
-            # Skip kradfile - will be downloaded separately from kensaku repository
-            elif 'kradfile' in name and name.endswith('.zip'):
-                print(f"Skipping Kradfile from jmdict-simplified (using kensaku instead): {name}")
-            
-            # Note: kradfile is downloaded from kensaku, radkfile from Kradical
-        
-        if not jmdict_url:
-            print("Warning: No jmdict-eng ZIP file found")
-        if not kanjidic_url:
-            print("Warning: No kanjidic2-en ZIP file found")
+            if not name.endswith('.zip'):
+                continue
+            
+            for key, proper_filename, label, edition_of in RELEASE_ASSET_MATCHERS:
+                if key not in name:
+                    continue
+                
+                # Skip kradfile - will be downloaded separately from kensaku repository
+                if proper_filename is None:
+                    print(f"Skipping {label} from jmdict-simplified (using kensaku instead): {name}")
+                    break
+                
+                # Later matches replace earlier ones unless they are a less preferred edition
+                edition = edition_of(name) if edition_of else None
+                rank = EDITION_PRIORITY[edition] if edition else 0
+                if proper_filename not in found or rank >= found[proper_filename][0]:
+                    found[proper_filename] = (rank, asset)
+                    edition_note = f" ({edition})" if edition else ""
+                    print(f"Found {label} file{edition_note}: {name}")
+                break
+        
+        target_assets = {}
+        for key, proper_filename, _, _ in RELEASE_ASSET_MATCHERS:
+            if proper_filename is None:
+                continue
+            if proper_filename in found:
+                target_assets[proper_filename] = found[proper_filename][1]
+            else:
+                target_assets[proper_filename] = None
+                print(f"Warning: No {key} ZIP file found")
         # Note: kradfile is downloaded from kensaku, radkfile from Kradical
             
-        return jmdict_url, kanjidic_url, kradfile_url, radkfile_url
+        return target_assets
+    
+    def download_release_asset(self, asset: Optional[Dict], proper_filename: str) -> Optional[Path]:
+        """Download and extract a release asset unless the same asset was already extracted to assets"""
+        if not asset:
+            return None
+        
+        # Asset ids and updated_at timestamps are stable, so an unchanged pair
+        # means the release file is the same as last run. The extracted file must
+        # also be untouched since then: custom modifications are appended to
+        # jmdict.json after download and must start from a clean copy.
+        final_path = self.assets_dir / proper_filename
+        asset_version = {'id': asset.get('id'), 'updated_at': asset.get('updated_at')}
+        # Assets are downloaded in parallel and the cache is saved from several
+        # threads, so every access to it goes through the lock
+        with self.release_cache_lock:
+            cached = dict(self.release_cache.get('assets', {}).get(proper_filename) or {})
+        if (asset_version['id'] is not None and self.is_extracted_file_unchanged(cached, final_path)
+                and {'id': cached.get('id'), 'updated_at': cached.get('updated_at')} == asset_version):
+            print(f"Unchanged since last download, keeping {final_path}")
+            return final_path
+        
+        download_url = asset['browser_download_url']
+        filename = download_url.split('/')[-1]
+        
+        for attempt in range(1, ZIP_DOWNLOAD_ATTEMPTS + 1):
+            # The ZIP is only needed long enough to extract it, so it never touches
+            # the downloads folder: it stays in memory, spilling to an anonymous
+            # temporary file only if it is unexpectedly large.
+            # It is hashed as it streams in, so a re-published but identical
+            # asset (new updated_at, same bytes) doesn't need to be extracted again.
+            zip_hash = hashlib.sha256()
+            with tempfile.SpooledTemporaryFile(max_size=ZIP_SPOOL_MAX_SIZE) as zip_buffer:
+                if not self.download_file(download_url, filename, zip_buffer, zip_hash):
+                    return None
+                
+                # A damaged download is fetched again rather than extracted
+                if not self.verify_zip(zip_buffer, filename):
+                    if attempt < ZIP_DOWNLOAD_ATTEMPTS:
+                        print(f"Downloading {filename} again...")
+                        continue
+                    return None
+                zip_sha256 = zip_hash.hexdigest()
+                
+                if cached.get('sha256') == zip_sha256 and self.is_extracted_file_unchanged(cached, final_path):
+                    print(f"Downloaded {filename} is identical to the last one, keeping {final_path}")
+                    extracted_path = final_path
+                else:
+                    extracted_path = self.extract_zip(zip_buffer, filename)
+            break
+        
+        if extracted_path:
+            stat = extracted_path.stat()
+            with self.release_cache_lock:
+                self.release_cache.setdefault('assets', {})[proper_filename] = dict(
+                    asset_version, sha256=zip_sha256, size=stat.st_size, mtime_ns=stat.st_mtime_ns
+                )
+                self.save_release_cache()
+        return extracted_path
     
-    def download_file(self, url: str, filename: str) -> bool:
-        """Download a file from URL to downloads directory"""
+    def is_extracted_file_unchanged(self, cached: Dict, final_path: Path) -> bool:
+        """Check that an extracted file still has the size and mtime recorded when it was extracted"""
+        try:
+            stat = final_path.stat()
+        except OSError:
+            return False
+        return cached.get('size') == stat.st_size and cached.get('mtime_ns') == stat.st_mtime_ns
+    
+    def download_file(self, url: str, filename: str, target: Optional[BinaryIO] = None,
+                      digest=None) -> bool:
+        """Download a file from URL to downloads directory, or into an open binary file if given
+
+        If a hashlib object is given as digest, it is updated with the downloaded bytes.
+        """
         if not url:
             return False
             
-        file_path = self.downloads_dir / filename
+        file_path = self.downloads_dir / filename if target is None else None
         
         try:
             print(f"Downloading {filename}...")
             
-            # Stream download for large files
-            response = requests.get(url, stream=True, timeout=60)
-            response.raise_for_status()
-            
-            total_size = int(response.headers.get('content-length', 0))
+            total_size = 0
             downloaded = 0
-            
-            with open(file_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        
-                        # Progress indicator
-                        if total_size > 0:
-                            percent = (downloaded / total_size) * 100
-                            print(f"\rProgress: {percent:.1f}%", end='', flush=True)
-            
-            print(f"\nDownloaded: {file_path}")
+            resume_attempts = 0
+            show_progress = False
+            next_progress = 0
+            
+            # Chunks are already 1 MiB, so the file needs no buffer of its own
+            with open(file_path, 'wb', buffering=0) if target is None else nullcontext(target) as f:
+                while True:
+                    # Stream download for large files; after a dropped connection,
+                    # ask only for the bytes that haven't arrived yet
+                    headers = {'Range': f'bytes={downloaded}-'} if downloaded else None
+                    response = self.session.get(url, stream=True, timeout=60, headers=headers)
+                    response.raise_for_status()
+                    
+                    if not total_size:
+                        total_size = int(response.headers.get('content-length', 0))
+                        # Progress is only drawn on a terminal, and at most about once per
+                        # percent; redrawing on every chunk costs a flushed write each time.
+                        # It goes to stderr so it stays out of captured stdout.
+                        show_progress = total_size > 0 and sys.stderr.isatty()
+                    
+                    # A server that ignores the Range header sends the whole file again
+                    skip = downloaded if response.status_code != 206 else 0
+                    
+                    error = None
+                    try:
+                        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                            if skip:
+                                if len(chunk) <= skip:
+                                    skip -= len(chunk)
+                                    continue
+                                chunk = chunk[skip:]
+                                skip = 0
+                            if chunk:
+                                f.write(chunk)
+                                if digest is not None:
+                                    digest.update(chunk)
+                                downloaded += len(chunk)
+                                
+                                # Progress indicator
+                                if show_progress and downloaded >= next_progress:
+                                    percent = (downloaded / total_size) * 100
+                                    sys.stderr.write(f"\rProgress: {percent:.1f}%")
+                                    sys.stderr.flush()
+                                    next_progress = downloaded + max(total_size // 100, PROGRESS_MIN_STEP)
+                    except (requests.ConnectionError, requests.Timeout,
+                            requests.exceptions.ChunkedEncodingError) as e:
+                        error = e
+                    
+                    # Content-Length is only comparable when the body isn't content-encoded
+                    if error is None and (downloaded >= total_size or 'content-encoding' in response.headers):
+                        break
+                    
+                    resume_attempts += 1
+                    if resume_attempts > DOWNLOAD_RESUME_ATTEMPTS:
+                        raise error or requests.RequestException(
+                            f"incomplete download ({downloaded} of {total_size} bytes)"
+                        )
+                    if show_progress:
+                        sys.stderr.write("\n")
+                    print(f"Connection interrupted after {downloaded} bytes, resuming...")
+            
+            if show_progress:
+                sys.stderr.write("\n")
+            print(f"Downloaded: {file_path or filename}")
             return True
             
         except requests.RequestException as e:
@@ -393,10 +746,32 @@ class DictionaryDownloader:
             print(f"\nError saving {filename}: {e}")
             return False
     
-    def extract_zip(self, zip_path: Path) -> Optional[Path]:
-        """Extract ZIP file to downloads folder, rename properly, then move to assets"""
+    def verify_zip(self, zip_file: BinaryIO, zip_name: str) -> bool:
+        """Check that a downloaded ZIP has a readable central directory whose entries all lie within the file
+
+        This needs no decompression; zipfile checks each entry's CRC-32 as it is extracted.
+        """
         try:
-            print(f"Extracting {zip_path.name}...")
+            zip_size = zip_file.seek(0, os.SEEK_END)
+            zip_file.seek(0)
+            with zipfile.ZipFile(zip_file, 'r') as zip_ref:
+                for info in zip_ref.infolist():
+                    if info.header_offset + info.compress_size > zip_size:
+                        print(f"Error: {zip_name} is truncated ({info.filename} runs past the end)")
+                        return False
+            return True
+        except zipfile.BadZipFile as e:
+            print(f"Error: {zip_name} is not a valid ZIP file: {e}")
+            return False
+        finally:
+            zip_file.seek(0)
+    
+    def extract_zip(self, zip_path: Union[Path, BinaryIO], zip_name: Optional[str] = None) -> Optional[Path]:
+        """Extract the JSON file from a ZIP (path or open binary file) straight into assets under its proper name"""
+        temp_path = None
+        zip_name = zip_name or zip_path.name
+        try:
+            print(f"Extracting {zip_name}...")
             
             with zipfile.ZipFile(zip_path, 'r') as zip_ref:
                 # List contents
@@ -404,75 +779,69 @@ class DictionaryDownloader:
                 json_files = [f for f in file_list if f.endswith('.json')]
                 
                 if not json_files:
-                    print(f"No JSON files found in {zip_path.name}")
+                    print(f"No JSON files found in {zip_name}")
                     return None
                 
-                # Extract the JSON file(s) to downloads folder first
+                # Extract the first JSON file
                 for json_file in json_files:
-                    # Get just the filename without any path
-                    original_filename = Path(json_file).name
-                    temp_extracted_path = self.downloads_dir / original_filename
-                    
-                    with zip_ref.open(json_file) as source, open(temp_extracted_path, 'wb') as target:
-                        target.write(source.read())
-                    
-                    print(f"Extracted to downloads: {temp_extracted_path}")
-                    
-                    # Determine the proper filename for assets
-                    proper_filename = self.get_proper_filename(original_filename)
+                    # Determine the proper filename for assets from the name without any path
+                    proper_filename = self.get_proper_filename(Path(json_file).name)
                     final_path = self.assets_dir / proper_filename
+                    temp_path = final_path.with_name(proper_filename + '.part')
+                    
+                    # Decompress in 1 MiB pieces next to the final path, with no
+                    # temporary copy in downloads and no whole-file buffer in memory
+                    with zip_ref.open(json_file) as source, open(temp_path, 'wb') as target:
+                        shutil.copyfileobj(source, target, length=1024 * 1024)
                     
-                    # Move and rename to assets directory (replacing if exists)
+                    # Swap the new file in atomically (same directory, so never a
+                    # cross-device rename); the old file stays intact if extraction fails
                     if final_path.exists():
                         print(f"Replacing existing {proper_filename}")
-                        final_path.unlink()  # Remove existing file first (Windows requirement)
+                    os.replace(temp_path, final_path)
                     
-                    temp_extracted_path.rename(final_path)
-                    print(f"Moved to assets as: {final_path}")
+                    print(f"Extracted to assets as: {final_path}")
                     
                     # Return the final path
                     return final_path
                     
-        except zipfile.BadZipFile as e:
-            print(f"Error: {zip_path.name} is not a valid ZIP file: {e}")
-            return None
-        except IOError as e:
-            print(f"Error extracting {zip_path.name}: {e}")
+        except (zipfile.BadZipFile, IOError) as e:
+            if isinstance(e, zipfile.BadZipFile):
+                print(f"Error: {zip_name} is not a valid ZIP file: {e}")
+            else:
+                print(f"Error extracting {zip_name}: {e}")
+            # Don't leave a truncated file behind in assets
+            if temp_path is not None:
+                temp_path.unlink(missing_ok=True)
             return None
     
     def get_proper_filename(self, original_filename: str) -> str:
         """Convert downloaded filename to proper assets filename"""
         filename_lower = original_filename.lower()
         
-        if 'jmdict-eng' in filename_lower and filename_lower.endswith('.json'):
-            return 'jmdict.json'
-        elif 'kanjidic2-en' in filename_lower and filename_lower.endswith('.json'):
-            return 'kanjidic.json'
-        elif 'kradfile' in filename_lower and filename_lower.endswith('.json'):
-            return 'kradfile.json'
-        elif 'radkfile' in filename_lower and filename_lower.endswith('.json'):
-            return 'radkfile.json'
-        else:
-            # Fallback: return original filename
-            print(f"Warning: Unrecognized filename pattern: {original_filename}")
-            return original_filename
+        if filename_lower.endswith('.json'):
+            for key, proper_filename in ASSET_FILENAMES:
+                if key in filename_lower:
+                    return proper_filename
+        
+        # Fallback: return original filename
+        print(f"Warning: Unrecognized filename pattern: {original_filename}")
+        return original_filename
     
     def cleanup_downloads(self):
         """Remove downloaded ZIP and JSON files to save space"""
         try:
             cleaned_count = 0
             
-            # Clean up ZIP files
-            for zip_file in self.downloads_dir.glob("*.zip"):
-                zip_file.unlink()
-                print(f"Cleaned up: {zip_file.name}")
-                cleaned_count += 1
-            
-            # Clean up any remaining JSON files in downloads
-            for json_file in self.downloads_dir.glob("*.json"):
-                json_file.unlink()
-                print(f"Cleaned up: {json_file.name}")
-                cleaned_count += 1
+            # Clean up ZIP files and any remaining JSON files in one pass over
+            # downloads (the release cache stays)
+            with os.scandir(self.downloads_dir) as entries:
+                for entry in entries:
+                    if (entry.name.endswith(('.zip', '.json')) and entry.is_file()
+                            and entry.name != self.release_cache_path.name):
+                        os.unlink(entry.path)
+                        print(f"Cleaned up: {entry.name}")
+                        cleaned_count += 1
             
             if cleaned_count == 0:
                 print("No temporary files to clean up")
@@ -496,34 +865,31 @@ class DictionaryDownloader:
             return None, None, None, None, None
         
         # Find target files
-        jmdict_url, kanjidic_url, kradfile_url, radkfile_url = self.find_target_assets(release_data)
-        
-        # Download files
-        jmdict_path = None
-        kanjidic_path = None
-        kradfile_path = None
-        radkfile_path = None
+        target_assets = self.find_target_assets(release_data)
         
-        if jmdict_url:
-            jmdict_filename = jmdict_url.split('/')[-1]
-            if self.download_file(jmdict_url, jmdict_filename):
-                jmdict_zip_path = self.downloads_dir / jmdict_filename
-                jmdict_path = self.extract_zip(jmdict_zip_path)
-        
-        if kanjidic_url:
-            kanjidic_filename = kanjidic_url.split('/')[-1]
-            if self.download_file(kanjidic_url, kanjidic_filename):
-                kanjidic_zip_path = self.downloads_dir / kanjidic_filename
-                kanjidic_path = self.extract_zip(kanjidic_zip_path)
-        
-        # Download kradfile with proper Unicode radicals from Kradical repository
-        kradfile_path = self.download_kradical_kradfile()
-        
-        # Download complete radkfile from Kradical repository
-        radkfile_path = self.download_kradical_radkfile()
+        # The five downloads are independent, so run them in parallel; total time
+        # is then the slowest download rather than the sum of all of them
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            # Release files (skipped when the asset hasn't changed since the last run)
+            release_futures = {
+                proper_filename: executor.submit(self.download_release_asset, asset, proper_filename)
+                for proper_filename, asset in target_assets.items()
+            }
+            
+            # Kradfile with proper Unicode radicals from Kradical repository
+            kradfile_future = executor.submit(self.download_kradical_kradfile)
+            
+            # Complete radkfile from Kradical repository
+            radkfile_future = executor.submit(self.download_kradical_radkfile)
+            
+            # Pitch accent data from Kanjium repository
+            accents_future = executor.submit(self.download_kanjium_accents)
         
-        # Download pitch accent data from Kanjium repository
-        accents_path = self.download_kanjium_accents()
+        jmdict_path = release_futures['jmdict.json'].result()
+        kanjidic_path = release_futures['kanjidic.json'].result()
+        kradfile_path = kradfile_future.result()
+        radkfile_path = radkfile_future.result()
+        accents_path = accents_future.result()
         
         # Cleanup if requested
         if cleanup:
@@ -574,10 +940,10 @@ def main():
     
     args = parser.parse_args()
     
-    downloader = DictionaryDownloader(args.dir, args.assets_dir)
-    jmdict_path, kanjidic_path, kradfile_path, radkfile_path, accents_path = downloader.download_latest_dictionaries(
-        cleanup=not args.no_cleanup
-    )
+    with DictionaryDownloader(args.dir, args.assets_dir) as downloader:
+        jmdict_path, kanjidic_path, kradfile_path, radkfile_path, accents_path = downloader.download_latest_dictionaries(
+            cleanup=not args.no_cleanup
+        )
     
     # Exit with appropriate code
     downloaded_count = sum(1 for path in [jmdict_path, kanjidic_path, kradfile_path, radkfile_path, accents_path] if path)
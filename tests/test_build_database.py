@@ -0,0 +1,106 @@
+"""Tests for the text format of the kanji_entries JSON columns written by build_database.py
+
+DictionaryDatabase.kt reads these columns as plain text (it strips the brackets
+and quotes, then replaces or splits on ", "), so the exact stored string matters,
+not just that it parses as JSON.
+
+Run from the repository root: python -m unittest discover tests
+"""
+
+import os
+import sqlite3
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from build_database import DatabaseBuilder, json_dumps_list
+
+
+KANJIDIC_ENTRY = {
+    "literal": "火",
+    "readingMeaning": {
+        "groups": [{
+            "meanings": [
+                {"lang": "en", "value": "fire"},
+                {"lang": "en", "value": "flame"},
+                {"lang": "fr", "value": "feu"},
+            ],
+            "readings": [
+                {"type": "ja_on", "value": "カ"},
+                {"type": "ja_kun", "value": "ひ"},
+                {"type": "ja_kun", "value": "-び"},
+                {"type": "ja_kun", "value": "ほ-"},
+            ],
+        }],
+        "nanori": ["や", "ほ"],
+    },
+    "misc": {"jlptLevel": 4, "grade": 1, "strokeCounts": [4], "frequency": 574},
+    "radicals": [{"type": "classical", "value": 86}],
+    "components": ["火", "丷"],
+}
+
+
+class JsonDumpsListTest(unittest.TestCase):
+    def test_items_are_separated_by_comma_space(self):
+        self.assertEqual(json_dumps_list(["fire", "flame"]), '["fire", "flame"]')
+
+    def test_non_ascii_is_not_escaped(self):
+        self.assertEqual(json_dumps_list(["ひ", "-び"]), '["ひ", "-び"]')
+
+    def test_empty_list(self):
+        self.assertEqual(json_dumps_list([]), "[]")
+
+    def test_scalar_is_wrapped(self):
+        self.assertEqual(json_dumps_list("カ"), '["カ"]')
+
+
+class KanjiEntriesFormatTest(unittest.TestCase):
+    def setUp(self):
+        # Only the schema and row-building methods are used, so skip __init__
+        # (it loads the frequency CSV and MeCab)
+        self.builder = DatabaseBuilder.__new__(DatabaseBuilder)
+        self.conn = sqlite3.connect(":memory:")
+        self.builder.create_kanjidic_schema(self.conn)
+
+    def tearDown(self):
+        self.conn.close()
+
+    def test_stored_json_columns(self):
+        self.builder.populate_kanji_entries(self.conn, [KANJIDIC_ENTRY])
+
+        row = self.conn.execute("""
+            SELECT meanings, kun_readings, on_readings, nanori_readings, radical_names, components
+            FROM kanji_entries WHERE kanji = '火'
+        """).fetchone()
+
+        self.assertEqual(row, (
+            '["fire", "flame"]',
+            '["ひ", "-び", "ほ-"]',
+            '["カ"]',
+            '["や", "ほ"]',
+            '["火"]',
+            '["火", "丷"]',
+        ))
+
+    def test_app_meaning_split_keeps_items(self):
+        # Mirrors the meanings parsing in DictionaryDatabase.kt
+        self.builder.populate_kanji_entries(self.conn, [KANJIDIC_ENTRY])
+        meanings = self.conn.execute("SELECT meanings FROM kanji_entries").fetchone()[0]
+
+        items = meanings.removeprefix("[").removesuffix("]").replace('"', "").split(", ")
+        self.assertEqual(items, ["fire", "flame"])
+
+    def test_empty_fields_are_empty_arrays(self):
+        entry = {"literal": "丷", "misc": {"strokeCounts": [2]}}
+        self.builder.populate_kanji_entries(self.conn, [entry])
+
+        row = self.conn.execute("""
+            SELECT meanings, kun_readings, on_readings, nanori_readings, radical_names, components
+            FROM kanji_entries WHERE kanji = '丷'
+        """).fetchone()
+        self.assertEqual(row, ("[]",) * 6)
+
+
+if __name__ == "__main__":
+    unittest.main()